@@ -97,6 +97,7 @@ class TestAutoClusteringDetection:
             ("1", False),  # Only "true" should be accepted
         ]
 
+        failures = []
         for property_value, expected_result in test_cases:
             table = TableInfo(
                 catalog="test_catalog",
@@ -107,9 +108,9 @@ class TestAutoClusteringDetection:
                 properties={"clusterByAuto": property_value},
             )
 
-            assert (
-                clustering_validator.has_auto_clustering(table) is expected_result
-            ), f"Failed for value: {property_value}"
+            if clustering_validator.has_auto_clustering(table) is not expected_result:
+                failures.append(f"Failed for value: {property_value}")
+        assert not failures, "\n".join(failures)
 
     def test_combination_explicit_and_auto_clustering(self, clustering_validator):
         """Test table with both explicit clustering columns AND automatic clustering."""
@@ -171,6 +172,23 @@ class TestAutoClusteringDetection:
         assert clustering_validator.cluster_by_auto_value == "true"
         assert clustering_validator.require_cluster_by_auto is False
 
+    def test_overridden_cluster_by_auto_value_is_respected(self, clustering_validator):
+        """Test that changing the expected clusterByAuto value takes effect, case-insensitively."""
+        table = TableInfo(
+            catalog="test_catalog",
+            schema="test_schema",
+            table="test_table",
+            comment="Test table with custom auto clustering value",
+            properties={"clusterByAuto": "yes"},
+        )
+        assert clustering_validator.has_auto_clustering(table) is False
+
+        clustering_validator.cluster_by_auto_value = "YES"
+
+        assert clustering_validator.cluster_by_auto_value == "YES"
+        assert clustering_validator.has_auto_clustering(table) is True
+        assert clustering_validator.get_auto_clustering_status(table) == "enabled"
+
     def test_edge_case_malformed_cluster_by_auto_data(self, clustering_validator):
         """Test handling of malformed clusterByAuto data."""
         test_cases = [
@@ -181,6 +199,7 @@ class TestAutoClusteringDetection:
             (123, False),  # Non-string value (should still work via str conversion)
         ]
 
+        failures = []
         for property_value, expected_result in test_cases:
             table = TableInfo(
                 catalog="test_catalog",
@@ -191,9 +210,9 @@ class TestAutoClusteringDetection:
                 properties={"clusterByAuto": property_value},
             )
 
-            assert (
-                clustering_validator.has_auto_clustering(table) is expected_result
-            ), f"Failed for value: {repr(property_value)}"
+            if clustering_validator.has_auto_clustering(table) is not expected_result:
+                failures.append(f"Failed for value: {repr(property_value)}")
+        assert not failures, "\n".join(failures)
 
     def test_auto_clustering_status_comprehensive(self, clustering_validator):
         """Test all possible auto clustering status scenarios."""
@@ -206,6 +225,7 @@ class TestAutoClusteringDetection:
             ({"other_prop": "value"}, "disabled", "clusterByAuto property missing"),
         ]
 
+        failures = []
         for properties, expected_status, description in test_cases:
             table = TableInfo(
                 catalog="test_catalog",
@@ -216,9 +236,9 @@ class TestAutoClusteringDetection:
                 properties=properties,
             )
 
-            assert (
-                clustering_validator.get_auto_clustering_status(table) == expected_status
-            ), f"Failed for: {description}"
+            if clustering_validator.get_auto_clustering_status(table) != expected_status:
+                failures.append(f"Failed for: {description}")
+        assert not failures, "\n".join(failures)
 
     def test_has_any_clustering_approach_scenarios(self, clustering_validator):
         """Test comprehensive scenarios for has_any_clustering_approach method."""
@@ -233,6 +253,7 @@ class TestAutoClusteringDetection:
             ([], "false", False, "Empty explicit clustering, auto disabled"),
         ]
 
+        failures = []
         for explicit, auto, expected, description in test_cases:
             properties = {}
             if explicit is not None:
@@ -250,4 +271,6 @@ class TestAutoClusteringDetection:
             )
 
             result = clustering_validator.has_any_clustering_approach(table)
-            assert result is expected, f"Failed for: {description} - Expected {expected}, got {result}"
+            if result is not expected:
+                failures.append(f"Failed for: {description} - Expected {expected}, got {result}")
+        assert not failures, "\n".join(failures)
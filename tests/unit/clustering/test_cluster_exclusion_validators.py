@@ -122,6 +122,7 @@ class TestClusterExclusionEdgeCases:
             {"cluster_exclusion": "tRuE"},
         ]
 
+        failures = []
         for properties in test_cases:
             table = TableInfo(
                 catalog="test_catalog",
@@ -132,8 +133,11 @@ class TestClusterExclusionEdgeCases:
                 properties=properties,
             )
 
-            assert clustering_validator.has_cluster_exclusion(table) is True
-            assert clustering_validator.get_cluster_exclusion_status(table) == "excluded"
+            if clustering_validator.has_cluster_exclusion(table) is not True:
+                failures.append(f"has_cluster_exclusion failed for value: {properties['cluster_exclusion']}")
+            if clustering_validator.get_cluster_exclusion_status(table) != "excluded":
+                failures.append(f"get_cluster_exclusion_status failed for value: {properties['cluster_exclusion']}")
+        assert not failures, "\n".join(failures)
 
     def test_cluster_exclusion_non_string_values(self, clustering_validator):
         """Test cluster_exclusion with non-string values."""
@@ -144,6 +148,7 @@ class TestClusterExclusionEdgeCases:
             {"cluster_exclusion": ""},  # Empty string
         ]
 
+        failures = []
         for properties in test_cases:
             table = TableInfo(
                 catalog="test_catalog",
@@ -156,7 +161,9 @@ class TestClusterExclusionEdgeCases:
 
             # Only string "true" (case insensitive) should be considered as exclusion
             expected_excluded = str(properties["cluster_exclusion"]).lower() == "true"
-            assert clustering_validator.has_cluster_exclusion(table) is expected_excluded
+            if clustering_validator.has_cluster_exclusion(table) is not expected_excluded:
+                failures.append(f"Failed for value: {properties['cluster_exclusion']!r}")
+        assert not failures, "\n".join(failures)
 
     def test_cluster_exclusion_with_other_clustering_approaches(self, clustering_validator):
         """Test cluster exclusion combined with other clustering approaches."""
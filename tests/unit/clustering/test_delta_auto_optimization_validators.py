@@ -236,6 +236,29 @@ class TestDeltaAutoOptimizationValidators:
         assert validator.auto_compact_value == "true"
         assert validator.require_both_delta_flags is True
 
+    def test_overridden_flag_values_are_respected(self, validator: ClusteringValidator):
+        """Test that changing the expected flag values takes effect, case-insensitively."""
+        table = TableInfo(
+            catalog="test_catalog",
+            schema="test_schema",
+            table="test_custom_values",
+            comment="Test table with custom delta optimization values",
+            columns=(),
+            properties={
+                "delta.autoOptimize.optimizeWrite": "on",
+                "delta.autoOptimize.autoCompact": "auto",
+            },
+        )
+        assert validator.has_delta_auto_optimization(table) is False
+
+        validator.optimize_write_value = "ON"
+        validator.auto_compact_value = "Auto"
+
+        assert validator.has_optimize_write(table) is True
+        assert validator.has_auto_compact(table) is True
+        assert validator.has_delta_auto_optimization(table) is True
+        assert validator.get_delta_auto_optimization_status(table)["has_optimize_write"] is True
+
     @pytest.mark.parametrize(
         "optimize_write_value,auto_compact_value,expected_has_optimize,expected_has_compact,expected_has_delta",
         [
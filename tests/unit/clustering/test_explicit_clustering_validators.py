@@ -227,3 +227,15 @@ class TestExplicitClusteringColumns:
         assert clustering_validator.has_clustering_columns(table) is True
         assert clustering_validator.get_clustering_columns(table) == ["valid_column"]
         assert clustering_validator.count_clustering_columns(table) == 1
+
+    def test_edge_case_non_list_clustering_groups(self, clustering_validator):
+        """Test that groups which are not lists are dropped when the clustering data is parsed."""
+        table = TableInfo(
+            catalog="test_catalog",
+            schema="test_schema",
+            table="test_table",
+            properties={"clusteringColumns": '["stray", ["valid_column"], 7]'},
+        )
+
+        assert clustering_validator.get_clustering_columns(table) == ["valid_column"]
+        assert clustering_validator.count_clustering_columns(table) == 1
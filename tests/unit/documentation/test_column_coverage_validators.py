@@ -269,3 +269,22 @@ class TestColumnCoverageThreshold:
 
         undocumented = validator.get_undocumented_columns(table)
         assert undocumented == []
+
+    def test_repeated_checks_on_same_table_are_consistent(self, validator):
+        """Test that coverage and undocumented lists agree when several checks run on one table."""
+        table = TableInfo(
+            catalog="test_catalog",
+            schema="test_schema",
+            table="test_table",
+            columns=(
+                ColumnInfo(name="user_id", type_text="INT", comment=None),
+                ColumnInfo(name="amount", type_text="DOUBLE", comment="Order total"),
+            ),
+        )
+
+        undocumented = validator.get_undocumented_columns(table)
+        undocumented.append("mutated_by_caller")
+
+        assert validator.calculate_column_documentation_percentage(table) == 50.0
+        assert validator.get_undocumented_columns(table) == ["user_id"]
+        assert validator.get_undocumented_critical_columns(table) == ["user_id"]
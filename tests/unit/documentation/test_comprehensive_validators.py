@@ -5,6 +5,7 @@ Tests the comprehensive validator that combines multiple individual checks.
 
 import pytest
 
+from tests.utils.config_loader import ConfigLoader
 from tests.utils.discovery import ColumnInfo, TableInfo
 from tests.validators.comprehensive import ComprehensiveDocumentationValidator
 
@@ -111,3 +112,61 @@ class TestComprehensiveDocumentationValidator:
         # Check individual results breakdown
         assert results[0].overall_compliant is True
         assert results[1].overall_compliant is False
+
+    def test_compliance_summary(self, comprehensive_validator):
+        """Test the human-readable summary for passing and failing tables."""
+        good_table = TableInfo("cat", "schema", "good_table", "Good table with comprehensive documentation")
+        bad_table = TableInfo("cat", "schema", "bad_table", None)
+
+        assert comprehensive_validator.evaluate_table_compliance(good_table).compliance_summary == "All checks passed"
+        assert comprehensive_validator.evaluate_table_compliance(bad_table).compliance_summary == (
+            "Passed: 3/5 checks. Failed: ['table_has_comment', 'table_comment_length']"
+        )
+
+    def test_summary_only_evaluation_matches_detailed(self, comprehensive_validator):
+        """Test that detailed=False skips per-table results but produces the same summary."""
+        tables = [
+            TableInfo("cat", "schema", "good_table", "Good table with comprehensive documentation"),
+            TableInfo("cat", "schema", "bad_table", None, (ColumnInfo("user_id", "INT"),)),
+        ]
+
+        detailed_results, detailed_summary = comprehensive_validator.evaluate_tables(tables)
+        summary_results, summary = comprehensive_validator.evaluate_tables(tables, detailed=False)
+
+        assert len(detailed_results) == 2
+        assert summary_results == []
+        assert summary == detailed_summary
+
+    def test_tables_with_identical_documentation_share_evaluation(self, comprehensive_validator):
+        """Test that duplicate comment/column content is evaluated once but reported per table."""
+        tables = [TableInfo("cat", "schema", f"table_{i}", "Short") for i in range(3)]
+
+        results, summary = comprehensive_validator.evaluate_tables(tables)
+
+        assert [result.table.table for result in results] == ["table_0", "table_1", "table_2"]
+        assert results[0].failure_reasons == results[2].failure_reasons
+        assert results[0].failure_reasons is not results[2].failure_reasons
+        assert summary["common_failures"] == {"Failed: table_comment_length": 3}
+
+    @pytest.mark.parametrize(
+        "check,expected",
+        [
+            ("column_coverage >= 50", True),
+            ("column_coverage > 50", False),
+            ("column_coverage <= 50", True),
+            ("column_coverage<60", True),
+            ("column_coverage == 50", True),
+            ("unknown_metric >= 10", False),
+        ],
+    )
+    def test_threshold_check_operators(self, monkeypatch, check, expected):
+        """Test threshold checks compare column coverage with each supported operator."""
+        monkeypatch.setattr(ConfigLoader, "get_comprehensive_rules", lambda self: {"required_checks": [check]})
+        validator = ComprehensiveDocumentationValidator()
+        table = TableInfo(
+            "cat", "schema", "half_documented", columns=(ColumnInfo("a", "INT", "Documented"), ColumnInfo("b", "INT"))
+        )
+
+        result = validator.evaluate_table_compliance(table)
+
+        assert result.overall_compliant is expected
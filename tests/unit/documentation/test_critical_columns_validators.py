@@ -209,3 +209,14 @@ class TestCriticalColumnDocumentation:
 
         undocumented = validator.get_undocumented_critical_columns(table)
         assert set(undocumented) == {"internal_user_id", "primary_email_address", "last_modified_timestamp"}
+
+    @pytest.mark.parametrize(
+        "column_name",
+        ["user_id", "customerId", "humidity", "EMAIL_ADDRESS", "product_name", "order_total", "created_at", "region"],
+    )
+    def test_automaton_matcher_agrees_with_combined_regex(self, validator, column_name):
+        """Test that the optional Aho-Corasick matcher classifies names like the combined regex."""
+        pytest.importorskip("ahocorasick")
+        combined_regex = validator._config_loader.get_critical_column_regex()
+
+        assert validator._is_column_critical(column_name) is (combined_regex.search(column_name) is not None)
@@ -40,9 +40,12 @@ class TestPlaceholderTextValidation:
             "N/A",
         ]
 
+        failures = []
         for comment in placeholder_comments:
             table = base_table._replace(comment=comment)
-            assert validator.has_placeholder_comment(table) is True, f"Should detect '{comment}' as placeholder"
+            if validator.has_placeholder_comment(table) is not True:
+                failures.append(f"Should detect '{comment}' as placeholder")
+        assert not failures, "\n".join(failures)
 
     def test_case_insensitive_detection(self, validator, base_table):
         """Test that placeholder detection is case-insensitive."""
@@ -59,10 +62,13 @@ class TestPlaceholderTextValidation:
             ("Tbd", True),
         ]
 
+        failures = []
         for comment, expected in test_cases:
             table = base_table._replace(comment=comment)
             result = validator.has_placeholder_comment(table)
-            assert result is expected, f"Comment '{comment}' should be detected as placeholder: {expected}"
+            if result is not expected:
+                failures.append(f"Comment '{comment}' should be detected as placeholder: {expected}")
+        assert not failures, "\n".join(failures)
 
     def test_obvious_placeholder_detection(self, validator, base_table):
         """Test that obvious placeholder patterns are detected."""
@@ -77,9 +83,12 @@ class TestPlaceholderTextValidation:
             "TEMP",  # TEMP standalone
         ]
 
+        failures = []
         for comment in obvious_placeholder_comments:
             table = base_table._replace(comment=comment)
-            assert validator.has_placeholder_comment(table) is True, f"Should detect placeholder in '{comment}'"
+            if validator.has_placeholder_comment(table) is not True:
+                failures.append(f"Should detect placeholder in '{comment}'")
+        assert not failures, "\n".join(failures)
 
     def test_valid_comments_not_flagged(self, validator, base_table):
         """Test that valid documentation comments are not flagged as placeholders."""
@@ -94,10 +103,13 @@ class TestPlaceholderTextValidation:
             ("Order processing and fulfillment data", False),
         ]
 
+        failures = []
         for comment, expected in test_cases:
             table = base_table._replace(comment=comment)
             result = validator.has_placeholder_comment(table)
-            assert result is expected, f"Comment '{comment}' expected: {expected}, got: {result}"
+            if result is not expected:
+                failures.append(f"Comment '{comment}' expected: {expected}, got: {result}")
+        assert not failures, "\n".join(failures)
 
     def test_edge_cases(self, validator, base_table):
         """Test edge cases for placeholder detection."""
@@ -116,10 +128,13 @@ class TestPlaceholderTextValidation:
             (" TBD ", True),
         ]
 
+        failures = []
         for comment, expected in edge_cases:
             table = base_table._replace(comment=comment)
             result = validator.has_placeholder_comment(table)
-            assert result is expected, f"Comment '{comment}' placeholder detection expected: {expected}, got: {result}"
+            if result is not expected:
+                failures.append(f"Comment '{comment}' placeholder detection expected: {expected}, got: {result}")
+        assert not failures, "\n".join(failures)
 
     def test_contextual_words_not_flagged(self, validator, base_table):
         """Test that placeholder words in legitimate context are not flagged."""
@@ -134,9 +149,12 @@ class TestPlaceholderTextValidation:
         ]
 
         # These should NOT be flagged as they're legitimate documentation
+        failures = []
         for comment in contextual_comments:
             table = base_table._replace(comment=comment)
-            assert validator.has_placeholder_comment(table) is False, f"Should NOT flag legitimate content '{comment}'"
+            if validator.has_placeholder_comment(table) is not False:
+                failures.append(f"Should NOT flag legitimate content '{comment}'")
+        assert not failures, "\n".join(failures)
 
     def test_boundary_patterns(self, validator, base_table):
         """Test boundary cases for pattern matching."""
@@ -162,10 +180,13 @@ class TestPlaceholderTextValidation:
             ("Temperature data", False),  # "temp" in context
         ]
 
+        failures = []
         for comment, expected in boundary_cases:
             table = base_table._replace(comment=comment)
             result = validator.has_placeholder_comment(table)
-            assert result is expected, f"Comment '{comment}' expected: {expected}, got: {result}"
+            if result is not expected:
+                failures.append(f"Comment '{comment}' expected: {expected}, got: {result}")
+        assert not failures, "\n".join(failures)
 
     def test_placeholder_vs_other_validations_independence(self, validator, base_table):
         """Test that placeholder validation is independent of other validations."""
@@ -206,10 +227,13 @@ class TestPlaceholderTextValidation:
             ("The hackathon event planning", False),  # Contains "hack" in context - should NOT be flagged
         ]
 
+        failures = []
         for comment, expected in legitimate_documentation:
             table = base_table._replace(comment=comment)
             result = validator.has_placeholder_comment(table)
-            assert result is expected, f"Comment '{comment}' precision test failed: expected {expected}, got {result}"
+            if result is not expected:
+                failures.append(f"Comment '{comment}' precision test failed: expected {expected}, got {result}")
+        assert not failures, "\n".join(failures)
 
     def test_start_of_comment_patterns(self, validator, base_table):
         """Test that placeholder patterns at start of comments are detected."""
@@ -227,7 +251,10 @@ class TestPlaceholderTextValidation:
             ("Review FIXME later", False),  # FIXME not at start
         ]
 
+        failures = []
         for comment, expected in start_pattern_cases:
             table = base_table._replace(comment=comment)
             result = validator.has_placeholder_comment(table)
-            assert result is expected, f"Start pattern test for '{comment}' failed: expected {expected}, got {result}"
+            if result is not expected:
+                failures.append(f"Start pattern test for '{comment}' failed: expected {expected}, got {result}")
+        assert not failures, "\n".join(failures)
@@ -3,22 +3,56 @@
 Tests table comment existence and length validation scenarios.
 """
 
+from functools import cache
+
 import pytest
 
 from tests.utils.discovery import TableInfo
 from tests.validators.documentation import DocumentationValidator
 
+# Both fixtures are session-scoped: the validator is only queried and TableInfo is
+# immutable (tests derive variations via _replace), so tests must never mutate them.
+
+_BASE_TABLE = TableInfo(catalog="test_catalog", schema="test_schema", table="test_table")
+
+# Unicode comment fixtures; their character counts are checked in test_minimum_length_with_unicode
+_U1 = "🚀"
+_U10 = "🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀"
+_UNICODE_17 = "café naïve résumé"
+_UNICODE_4 = "café"
+
+_MULTI_TABLE_CASES = [
+    (TableInfo("cat1", "schema1", "table1", "Good comment"), True),
+    (TableInfo("cat1", "schema1", "table2", None), False),
+    (TableInfo("cat1", "schema1", "table3", ""), False),
+    (TableInfo("cat1", "schema1", "table4", "Another good comment"), True),
+]
+
+_MULTI_TABLE_LENGTH_CASES = [
+    (TableInfo("cat", "schema", "table1", "Valid comment that is long enough"), True),
+    (TableInfo("cat", "schema", "table2", "Short"), False),
+    (TableInfo("cat", "schema", "table3", None), False),
+    (TableInfo("cat", "schema", "table4", "Ten chars!"), True),
+    (TableInfo("cat", "schema", "table5", "Nine chr"), False),
+]
+
 
-@pytest.fixture
+@cache
+def _validator() -> DocumentationValidator:
+    """Build the shared DocumentationValidator once so config is loaded a single time."""
+    return DocumentationValidator()
+
+
+@pytest.fixture(scope="session")
 def validator():
     """Fixture providing a DocumentationValidator instance."""
-    return DocumentationValidator()
+    return _validator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def base_table():
     """Fixture providing a base TableInfo for test variations."""
-    return TableInfo(catalog="test_catalog", schema="test_schema", table="test_table")
+    return _BASE_TABLE
 
 
 class TestTableCommentValidation:
@@ -28,21 +62,24 @@ class TestTableCommentValidation:
     """
 
     @pytest.mark.parametrize(
-        "comment,expected",
+        "table,expected",
         [
-            ("Valid table comment", True),
-            ("Short comment", True),
-            ("Multi-line comment\nwith details", True),
-            (None, False),
-            ("", False),
-            ("   ", False),
-            ("\n\t  \n", False),
-            (" ", False),
+            (_BASE_TABLE._replace(comment=comment), expected)
+            for comment, expected in [
+                ("Valid table comment", True),
+                ("Short comment", True),
+                ("Multi-line comment\nwith details", True),
+                (None, False),
+                ("", False),
+                ("   ", False),
+                ("\n\t  \n", False),
+                (" ", False),
+            ]
         ],
+        ids=["valid", "short", "multiline", "none", "empty", "ws3", "ws_mixed", "ws1"],
     )
-    def test_has_comment_with_various_inputs(self, validator, base_table, comment, expected):
+    def test_has_comment_with_various_inputs(self, validator, table, expected):
         """Test has_comment with various comment values using parametrize."""
-        table = base_table._replace(comment=comment)
         result = validator.has_comment(table)
         assert result is expected
 
@@ -65,18 +102,21 @@ class TestTableCommentValidation:
         assert validator.has_comment(table) is False
 
     @pytest.mark.parametrize(
-        "whitespace_comment",
+        "table",
         [
-            "   ",
-            "\n",
-            "\t",
-            "  \n\t  ",
-            "\r\n  \t",
+            _BASE_TABLE._replace(comment=whitespace_comment)
+            for whitespace_comment in [
+                "   ",
+                "\n",
+                "\t",
+                "  \n\t  ",
+                "\r\n  \t",
+            ]
         ],
+        ids=["spaces", "newline", "tab", "mixed", "crlf_tab"],
     )
-    def test_has_comment_with_whitespace_only(self, validator, base_table, whitespace_comment):
+    def test_has_comment_with_whitespace_only(self, validator, table):
         """Test has_comment with various whitespace-only comments - should FAIL."""
-        table = base_table._replace(comment=whitespace_comment)
         assert validator.has_comment(table) is False
 
     def test_tableinfo_has_comment_method(self, base_table):
@@ -96,15 +136,8 @@ class TestTableCommentValidation:
 
     def test_validator_with_multiple_tables(self, validator):
         """Test validator handles multiple table validations correctly."""
-        tables = [
-            TableInfo("cat1", "schema1", "table1", "Good comment"),
-            TableInfo("cat1", "schema1", "table2", None),
-            TableInfo("cat1", "schema1", "table3", ""),
-            TableInfo("cat1", "schema1", "table4", "Another good comment"),
-        ]
-
-        results = [validator.has_comment(table) for table in tables]
-        expected = [True, False, False, True]
+        results = [validator.has_comment(table) for table, _ in _MULTI_TABLE_CASES]
+        expected = [expected for _, expected in _MULTI_TABLE_CASES]
 
         assert results == expected
 
@@ -116,30 +149,49 @@ class TestCommentLengthValidation:
     """
 
     @pytest.mark.parametrize(
-        "comment,expected",
+        "table,expected",
         [
-            # Valid comments (10+ characters)
-            ("This is a valid comment", True),
-            ("Ten chars!", True),
-            ("Longer comment with detailed description", True),
-            ("🚀 Unicode comment", True),
-            ("   Leading and trailing spaces   ", True),
-            # Invalid comments (< 10 characters)
-            ("Short", False),
-            ("Nine char", False),
-            ("A", False),
-            ("", False),
-            ("   ", False),
-            (None, False),
-            ("🚀", False),
-            ("🚀🚀🚀🚀🚀🚀🚀🚀🚀🚀", True),  # 10 Unicode characters
-            ("\n\t Test \n", False),
-            ("Tab\tSeparated\tComment", True),
+            (_BASE_TABLE._replace(comment=comment), expected)
+            for comment, expected in [
+                # Valid comments (10+ characters)
+                ("This is a valid comment", True),
+                ("Ten chars!", True),
+                ("Longer comment with detailed description", True),
+                ("🚀 Unicode comment", True),
+                ("   Leading and trailing spaces   ", True),
+                # Invalid comments (< 10 characters)
+                ("Short", False),
+                ("Nine char", False),
+                ("A", False),
+                ("", False),
+                ("   ", False),
+                (None, False),
+                (_U1, False),
+                (_U10, True),  # 10 Unicode characters
+                ("\n\t Test \n", False),
+                ("Tab\tSeparated\tComment", True),
+            ]
+        ],
+        ids=[
+            "valid_23",
+            "ten_exact",
+            "long_desc",
+            "unicode",
+            "ws_around",
+            "short_5",
+            "short_9",
+            "single_char",
+            "empty",
+            "ws3",
+            "none",
+            "unicode1",
+            "unicode10",
+            "only_ws",
+            "tabs",
         ],
     )
-    def test_has_minimum_length_with_various_inputs(self, validator, base_table, comment, expected):
+    def test_has_minimum_length_with_various_inputs(self, validator, table, expected):
         """Test has_minimum_length with various inputs using parametrize."""
-        table = base_table._replace(comment=comment)
         result = validator.has_minimum_length(table)
         assert result is expected
 
@@ -163,16 +215,17 @@ class TestCommentLengthValidation:
     def test_minimum_length_with_unicode(self, validator, base_table):
         """Test minimum length calculation with Unicode characters."""
         # Unicode characters should count as 1 character each
-        unicode_comment = "café naïve résumé"  # 17 characters including spaces
-        table = base_table._replace(comment=unicode_comment)
+        assert len(_U1) == 1
+        assert len(_U10) == 10
+        assert len(_UNICODE_17) == 17  # including spaces
+        assert len(_UNICODE_4) == 4
+
+        table = base_table._replace(comment=_UNICODE_17)
         assert validator.has_minimum_length(table) is True
-        assert len(unicode_comment) == 17
 
-        # Short Unicode - should fail
-        short_unicode = "café"  # 4 characters
-        table_short = base_table._replace(comment=short_unicode)
+        # Short Unicode (4 characters) - should fail
+        table_short = base_table._replace(comment=_UNICODE_4)
         assert validator.has_minimum_length(table_short) is False
-        assert len(short_unicode) == 4
 
     def test_minimum_length_none_handling(self, validator, base_table):
         """Test that None comments are handled correctly."""
@@ -200,16 +253,8 @@ class TestCommentLengthValidation:
 
     def test_minimum_length_with_multiple_tables(self, validator):
         """Test minimum length validation across multiple tables."""
-        tables = [
-            TableInfo("cat", "schema", "table1", "Valid comment that is long enough"),
-            TableInfo("cat", "schema", "table2", "Short"),
-            TableInfo("cat", "schema", "table3", None),
-            TableInfo("cat", "schema", "table4", "Ten chars!"),
-            TableInfo("cat", "schema", "table5", "Nine chr"),
-        ]
-
-        results = [validator.has_minimum_length(table) for table in tables]
-        expected = [True, False, False, True, False]
+        results = [validator.has_minimum_length(table) for table, _ in _MULTI_TABLE_LENGTH_CASES]
+        expected = [expected for _, expected in _MULTI_TABLE_LENGTH_CASES]
 
         assert results == expected
 
@@ -229,3 +274,22 @@ class TestCommentLengthValidation:
         none_table = base_table._replace(comment=None)
         assert validator.has_comment(none_table) is False
         assert validator.has_minimum_length(none_table) is False
+
+
+class TestCombinedCommentAnalysis:
+    """Test that analyze_comment() agrees with the individual table comment checks."""
+
+    @pytest.mark.parametrize(
+        "comment",
+        [None, "", "   ", "TODO", "todo: fill in", "Short", "Ten chars!", "Customer purchase history", _U10],
+        ids=["none", "empty", "ws", "todo", "todo_prefix", "short", "ten", "prose", "unicode10"],
+    )
+    def test_analyze_comment_matches_individual_checks(self, validator, base_table, comment):
+        """Test analyze_comment returns has_comment, has_minimum_length and has_placeholder_comment."""
+        table = base_table._replace(comment=comment)
+
+        assert validator.analyze_comment(table) == (
+            validator.has_comment(table),
+            validator.has_minimum_length(table),
+            validator.has_placeholder_comment(table),
+        )
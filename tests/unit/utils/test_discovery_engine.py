@@ -0,0 +1,214 @@
+"""Unit tests for DatabricksDiscovery.
+
+Uses an in-memory fake workspace client whose listings are lazy generators, so tests can
+check both what discovery returns and how much it pulled from the SDK.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+
+from tests.utils.discovery_engine import (
+    MAX_DISCOVERY_WORKERS,
+    DatabricksDiscovery,
+    DiscoveryConfig,
+    create_production_discovery,
+)
+
+
+class _FakeClient:
+    """Workspace client stand-in serving `tables_per_schema` tables in every catalog/schema.
+
+    Counts every SDK table handed out and records the peak number of concurrent listing calls.
+    """
+
+    def __init__(self, catalogs, schemas, tables_per_schema, delay=0.0, end_delay=0.0):
+        self._schemas = schemas
+        self._tables_per_schema = tables_per_schema
+        self._delay = delay
+        self._end_delay = end_delay
+        self._lock = threading.Lock()
+        self._active = 0
+        self.fetched = 0
+        self.peak_concurrency = 0
+        self.catalogs = SimpleNamespace(list=lambda: [SimpleNamespace(name=name) for name in catalogs])
+        self.schemas = SimpleNamespace(list=self._list_schemas)
+        self.tables = SimpleNamespace(list=self._list_tables)
+
+    def _enter(self):
+        with self._lock:
+            self._active += 1
+            self.peak_concurrency = max(self.peak_concurrency, self._active)
+
+    def _exit(self):
+        with self._lock:
+            self._active -= 1
+
+    def _list_schemas(self, catalog_name):
+        self._enter()
+        try:
+            time.sleep(self._delay)
+            schemas = self._schemas(catalog_name) if callable(self._schemas) else self._schemas
+            return [SimpleNamespace(name=name) for name in schemas]
+        finally:
+            self._exit()
+
+    def _list_tables(self, catalog_name, schema_name):
+        # Like the SDK, the listing is lazy: nothing is fetched until the caller iterates
+        for i in range(self._tables_per_schema):
+            self._enter()
+            try:
+                time.sleep(self._delay)
+                with self._lock:
+                    self.fetched += 1
+            finally:
+                self._exit()
+            yield SimpleNamespace(name=f"t{i}", columns=None, comment=None, properties=None)
+        # Finding out a listing has no more pages costs a round-trip too
+        time.sleep(self._end_delay)
+
+
+def test_listing_concurrency_bounded_by_max_workers():
+    """All catalog and schema listings share one pool of MAX_DISCOVERY_WORKERS threads."""
+    client = _FakeClient(
+        catalogs=[f"c{i}" for i in range(8)],
+        schemas=[f"s{i}" for i in range(8)],
+        tables_per_schema=2,
+        delay=0.002,
+    )
+    discovery = DatabricksDiscovery(client, DiscoveryConfig())
+
+    tables = discovery.discover_tables()
+
+    assert len(tables) == 8 * 8 * 2
+    assert 1 < client.peak_concurrency <= MAX_DISCOVERY_WORKERS
+
+
+def test_max_total_tables_bounds_sdk_fetches():
+    """The total cap is shared by every listing, so discovery stops fetching once it is reached."""
+    client = _FakeClient(
+        catalogs=[f"c{i}" for i in range(20)],
+        schemas=[f"s{i}" for i in range(20)],
+        tables_per_schema=50,
+    )
+    discovery = DatabricksDiscovery(client, DiscoveryConfig(max_total_tables=100))
+
+    tables = discovery.discover_tables()
+
+    assert len(tables) == 100
+    assert client.fetched == 100
+
+
+def test_max_total_tables_reached_despite_slow_final_pages():
+    """Claims still in flight near the cap are waited on rather than treated as spent budget."""
+    client = _FakeClient(
+        catalogs=[f"c{i}" for i in range(60)],
+        schemas=["s"],
+        tables_per_schema=3,
+        end_delay=0.01,
+    )
+    discovery = DatabricksDiscovery(client, DiscoveryConfig(max_total_tables=60))
+
+    tables = discovery.discover_tables()
+
+    assert len(tables) == 60
+    assert client.fetched == 60
+
+
+class TestDatabricksDiscovery:
+    """Ordering, caps and failure handling of iter_tables / discover_tables."""
+
+    def test_iter_tables_yields_in_catalog_then_schema_order(self):
+        """Tables come out in catalog, then schema, then listing order regardless of completion order."""
+        client = _FakeClient(catalogs=["a", "b", "c"], schemas=["x", "y"], tables_per_schema=2)
+        discovery = DatabricksDiscovery(client, DiscoveryConfig())
+
+        names = [table.full_name for table in discovery.iter_tables()]
+
+        assert names == [f"{c}.{s}.t{i}" for c in ("a", "b", "c") for s in ("x", "y") for i in range(2)]
+
+    def test_discover_tables_matches_iter_tables(self):
+        """discover_tables is the eager form of iter_tables."""
+        client = _FakeClient(catalogs=["a", "b"], schemas=["x"], tables_per_schema=3)
+        discovery = DatabricksDiscovery(client, DiscoveryConfig())
+
+        tables = discovery.discover_tables()
+
+        assert isinstance(tables, list)
+        assert tables == list(discovery.iter_tables())
+
+    def test_target_catalogs_and_schemas_filter_listing(self):
+        """Configured catalogs skip catalog listing and target_schemas filters schemas."""
+        client = _FakeClient(catalogs=["unused"], schemas=["x", "y", "z"], tables_per_schema=1)
+        config = DiscoveryConfig(target_catalogs=["a"], target_schemas=["y"])
+
+        names = [table.full_name for table in DatabricksDiscovery(client, config).iter_tables()]
+
+        assert names == ["a.y.t0"]
+
+    def test_early_close_stops_listing(self):
+        """Closing the generator stops outstanding listings instead of draining every schema."""
+        # More schemas than workers, so some listings are still queued when the consumer stops
+        client = _FakeClient(
+            catalogs=["a", "b"], schemas=[f"s{i}" for i in range(20)], tables_per_schema=50, delay=0.001
+        )
+        tables = DatabricksDiscovery(client, DiscoveryConfig()).iter_tables()
+
+        first = next(tables)
+        tables.close()
+        fetched_at_close = client.fetched
+
+        assert first.full_name == "a.s0.t0"
+        assert fetched_at_close < 2 * 20 * 50
+        assert client.fetched == fetched_at_close
+
+    def test_max_tables_per_schema_caps_each_schema(self):
+        """Each schema contributes at most max_tables_per_schema tables, without fetching past it."""
+        client = _FakeClient(catalogs=["a"], schemas=["x", "y"], tables_per_schema=10)
+        config = DiscoveryConfig(max_tables_per_schema=3)
+
+        tables = DatabricksDiscovery(client, config).discover_tables()
+
+        assert [table.full_name for table in tables] == [f"a.{s}.t{i}" for s in ("x", "y") for i in range(3)]
+        assert client.fetched == 6
+
+    def test_catalog_with_failing_schema_listing_is_skipped(self):
+        """A catalog whose schemas cannot be listed is logged and skipped; other catalogs still return."""
+
+        def schemas(catalog_name):
+            if catalog_name == "broken":
+                raise PermissionError("no USE CATALOG")
+            return ["x"]
+
+        client = _FakeClient(catalogs=["a", "broken", "b"], schemas=schemas, tables_per_schema=1)
+
+        names = [table.full_name for table in DatabricksDiscovery(client, DiscoveryConfig()).iter_tables()]
+
+        assert names == ["a.x.t0", "b.x.t0"]
+
+    def test_system_catalogs_skipped_by_default(self):
+        """Production discovery leaves out system catalogs unless include_system_catalogs is set."""
+        client = _FakeClient(catalogs=["system", "main"], schemas=["x"], tables_per_schema=1)
+
+        default = DatabricksDiscovery(client, DiscoveryConfig()).discover_tables()
+        included = DatabricksDiscovery(client, DiscoveryConfig(include_system_catalogs=True)).discover_tables()
+
+        assert [table.catalog for table in default] == ["main"]
+        assert [table.catalog for table in included] == ["system", "main"]
+
+
+def test_production_discovery_configs_are_independent(monkeypatch):
+    """Engines built from the same environment get their own config, so changes never leak between them."""
+    monkeypatch.setenv("DISCOVERY_TARGET_CATALOGS", "main,samples")
+    monkeypatch.setenv("DISCOVERY_TARGET_SCHEMAS", "sales")
+    monkeypatch.delenv("DISCOVERY_MAX_TABLES", raising=False)
+    client = _FakeClient(catalogs=[], schemas=[], tables_per_schema=0)
+
+    first = create_production_discovery(client)
+    first.config.target_catalogs.append("scratch")
+    first.config.max_total_tables = 1
+    second = create_production_discovery(client)
+
+    assert second.config.target_catalogs == ["main", "samples"]
+    assert second.config.target_schemas == ["sales"]
+    assert second.config.max_total_tables == 5000
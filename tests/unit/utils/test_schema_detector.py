@@ -4,35 +4,75 @@ Tests the research-based schema detection implementation with proper mocking
 and edge case validation.
 """
 
+from collections import namedtuple
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
 from databricks.sdk.service.catalog import ColumnInfo, ColumnTypeName
+from databricks.sdk.service.sql import StatementState
 
-from tests.utils.schema_detector import SchemaDetectionError, SchemaDetector
+from tests.utils.discovery import ColumnInfo as DiscoveredColumn
+from tests.utils.discovery import TableInfo
+from tests.utils.schema_detector import BULK_QUERY_CHUNK_SIZE, SchemaDetectionError, SchemaDetector
+
+# Lightweight stand-ins for StatementResponse; only attribute reads are needed, not call tracking
+_Response = namedtuple("_Response", "statement_id status result")
+_Status = namedtuple("_Status", "state")
+_Inner = namedtuple("_Inner", "data_array next_chunk_index")
+
+
+# Column payloads are immutable SDK dataclasses in tuples, so they are shared across tests.
+@pytest.fixture(scope="session")
+def id_long_columns():
+    """Single LONG id column."""
+    return (ColumnInfo(name="id", type_name=ColumnTypeName.LONG),)
+
+
+@pytest.fixture(scope="session")
+def id_data_columns():
+    """LONG id column plus a STRING data column."""
+    return (
+        ColumnInfo(name="id", type_name=ColumnTypeName.LONG),
+        ColumnInfo(name="data", type_name=ColumnTypeName.STRING),
+    )
+
+
+@pytest.fixture(scope="session")
+def mixed_type_columns():
+    """Columns covering several ColumnTypeName enum values."""
+    return (
+        ColumnInfo(name="id", type_name=ColumnTypeName.LONG),
+        ColumnInfo(name="name", type_name=ColumnTypeName.STRING),
+        ColumnInfo(name="price", type_name=ColumnTypeName.DOUBLE),
+        ColumnInfo(name="created_at", type_name=ColumnTypeName.TIMESTAMP),
+    )
+
+
+@pytest.fixture
+def mock_client():
+    """Mock Databricks WorkspaceClient limited to the APIs SchemaDetector uses.
+
+    spec_set stops typos from silently creating attributes; reset_mock() drops recorded
+    calls and child mocks once the test is done.
+    """
+    client = Mock(spec_set=["tables", "statement_execution"])
+    yield client
+    client.reset_mock()
 
 
 class TestSchemaDetector:
     """Unit tests for SchemaDetector with comprehensive method coverage."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Mock Databricks WorkspaceClient."""
-        return Mock()
-
     @pytest.fixture
     def detector(self, mock_client):
         """SchemaDetector instance with mocked client."""
         return SchemaDetector(mock_client)
 
-    def test_native_sdk_success(self, detector, mock_client):
+    def test_native_sdk_success(self, detector, mock_client, id_data_columns):
         """Test successful schema detection via native SDK."""
         # Setup mock table info
-        mock_table_info = Mock()
-        mock_table_info.columns = [
-            ColumnInfo(name="id", type_name=ColumnTypeName.LONG),
-            ColumnInfo(name="data", type_name=ColumnTypeName.STRING),
-        ]
+        mock_table_info = SimpleNamespace(columns=id_data_columns)
         mock_client.tables.get.return_value = mock_table_info
 
         result = detector.get_table_schema("workspace.test.table")
@@ -42,8 +82,7 @@ class TestSchemaDetector:
 
     def test_native_sdk_no_columns(self, detector, mock_client):
         """Test native SDK failure when table has no columns."""
-        mock_table_info = Mock()
-        mock_table_info.columns = None
+        mock_table_info = SimpleNamespace(columns=None)
         mock_client.tables.get.return_value = mock_table_info
 
         with pytest.raises(SchemaDetectionError) as exc_info:
@@ -64,26 +103,20 @@ class TestSchemaDetector:
     @pytest.mark.parametrize(
         "table_name", ["catalog.schema.table", "workspace.pytest_test_data.size_exemption_test_small_table"]
     )
-    def test_valid_table_name_formats(self, detector, mock_client, table_name):
+    def test_valid_table_name_formats(self, detector, mock_client, id_long_columns, table_name):
         """Test that valid table name formats are handled correctly."""
-        mock_table_info = Mock()
-        mock_table_info.columns = [ColumnInfo(name="id", type_name=ColumnTypeName.LONG)]
+        mock_table_info = SimpleNamespace(columns=id_long_columns)
         mock_client.tables.get.return_value = mock_table_info
 
         result = detector.get_table_schema(table_name)
+        cached_result = detector.get_table_schema(table_name)
 
-        assert result == [("id", "LONG")]
+        assert result == cached_result == [("id", "LONG")]
         mock_client.tables.get.assert_called_once_with(table_name)
 
-    def test_enum_to_string_conversion(self, detector, mock_client):
+    def test_enum_to_string_conversion(self, detector, mock_client, mixed_type_columns):
         """Test proper conversion of ColumnTypeName enums to strings."""
-        mock_table_info = Mock()
-        mock_table_info.columns = [
-            ColumnInfo(name="id", type_name=ColumnTypeName.LONG),
-            ColumnInfo(name="name", type_name=ColumnTypeName.STRING),
-            ColumnInfo(name="price", type_name=ColumnTypeName.DOUBLE),
-            ColumnInfo(name="created_at", type_name=ColumnTypeName.TIMESTAMP),
-        ]
+        mock_table_info = SimpleNamespace(columns=mixed_type_columns)
         mock_client.tables.get.return_value = mock_table_info
 
         result = detector.get_table_schema("workspace.test.table")
@@ -91,13 +124,214 @@ class TestSchemaDetector:
         expected = [("id", "LONG"), ("name", "STRING"), ("price", "DOUBLE"), ("created_at", "TIMESTAMP")]
         assert result == expected
 
+    def test_invalidate_forces_refetch(self, detector, mock_client, id_long_columns, id_data_columns):
+        """Test that invalidate() drops cached schemas for one table or all tables."""
+        mock_client.tables.get.return_value = SimpleNamespace(columns=id_long_columns)
+        detector.get_table_schema("workspace.test.table")
+
+        mock_client.tables.get.return_value = SimpleNamespace(columns=id_data_columns)
+        detector.invalidate("workspace.test.table")
+        assert detector.get_table_schema("workspace.test.table") == [("id", "LONG"), ("data", "STRING")]
+
+        detector.invalidate()
+        detector.get_table_schema("workspace.test.table")
+        assert mock_client.tables.get.call_count == 3
+
     def test_empty_columns_handling(self, detector, mock_client):
         """Test handling of tables with empty column lists."""
-        mock_table_info = Mock()
-        mock_table_info.columns = []
+        mock_table_info = SimpleNamespace(columns=[])
         mock_client.tables.get.return_value = mock_table_info
 
         with pytest.raises(SchemaDetectionError) as exc_info:
             detector.get_table_schema("workspace.test.table")
 
         assert "has no columns metadata" in str(exc_info.value)
+
+    def test_schema_from_table_info(self, detector, mock_client):
+        """Test that discovered TableInfo columns convert to a schema without calling the SDK."""
+        table = TableInfo(
+            "workspace",
+            "test",
+            "table",
+            columns=(
+                DiscoveredColumn("id", "bigint"),
+                DiscoveredColumn("amount", "decimal(10,2)"),
+                DiscoveredColumn("tags", "array<string>"),
+            ),
+        )
+
+        result = detector.schema_from_table_info(table)
+
+        assert result == [("id", "LONG"), ("amount", "DECIMAL"), ("tags", "ARRAY")]
+        mock_client.tables.get.assert_not_called()
+
+    def test_schema_from_table_info_without_columns(self, detector):
+        """Test that a TableInfo without columns raises like the SDK path."""
+        with pytest.raises(SchemaDetectionError, match="has no columns metadata"):
+            detector.schema_from_table_info(TableInfo("workspace", "test", "table"))
+
+
+class TestSchemaDetectorBulk:
+    """Unit tests for bulk schema detection via information_schema."""
+
+    @pytest.fixture
+    def detector(self, mock_client):
+        """SchemaDetector with a warehouse configured for bulk queries."""
+        return SchemaDetector(mock_client, warehouse_id="test-warehouse")
+
+    @staticmethod
+    def _statement_response(rows):
+        """Build a successful single-chunk statement response carrying the given rows."""
+        return _Response(
+            statement_id="stmt-1",
+            status=_Status(state=StatementState.SUCCEEDED),
+            result=_Inner(data_array=rows, next_chunk_index=None),
+        )
+
+    @pytest.mark.parametrize("table_count", [1, 3, BULK_QUERY_CHUNK_SIZE + 1])
+    def test_bulk_query_per_chunk(self, detector, mock_client, table_count):
+        """Test one statement per chunk of tables and no per-table SDK calls."""
+        table_names = [f"workspace.test.table_{i}" for i in range(table_count)]
+        mock_client.statement_execution.execute_statement.side_effect = lambda **kwargs: self._statement_response(
+            [
+                [name.split(".")[2], "id", "BIGINT"]
+                for name in table_names
+                if name.split(".")[2] in {param.value for param in kwargs["parameters"]}
+            ]
+        )
+
+        result = detector.get_table_schemas(table_names)
+
+        assert result == {name: [("id", "LONG")] for name in table_names}
+        expected_statements = -(-table_count // BULK_QUERY_CHUNK_SIZE)
+        assert mock_client.statement_execution.execute_statement.call_count == expected_statements
+        mock_client.tables.get.assert_not_called()
+
+    def test_bulk_query_binds_names_as_parameters(self, detector, mock_client):
+        """Test that catalog, schema and table names are bound rather than interpolated into the SQL."""
+        mock_client.statement_execution.execute_statement.return_value = self._statement_response([])
+        mock_client.tables.get.return_value = SimpleNamespace(columns=[ColumnInfo(name="id", type_name=None)])
+
+        detector.get_table_schemas(["cat.s'x.t1", "cat.s'x.t2"])
+
+        kwargs = mock_client.statement_execution.execute_statement.call_args.kwargs
+        assert "s'x" not in kwargs["statement"]
+        assert "IN (:t0, :t1)" in kwargs["statement"]
+        assert {(param.name, param.value) for param in kwargs["parameters"]} == {
+            ("columns_view", "`cat`.information_schema.columns"),
+            ("schema", "s'x"),
+            ("t0", "t1"),
+            ("t1", "t2"),
+        }
+
+    def test_bulk_matches_mixed_case_schema_and_table_names(self, detector, mock_client):
+        """Test that mixed-case names are lowercased to match information_schema's stored names."""
+        mock_client.statement_execution.execute_statement.return_value = self._statement_response(
+            [["orders", "id", "BIGINT"]]
+        )
+
+        result = detector.get_table_schemas(["Main.Sales.Orders"])
+
+        assert result == {"Main.Sales.Orders": [("id", "LONG")]}
+        parameters = {
+            param.name: param.value
+            for param in mock_client.statement_execution.execute_statement.call_args.kwargs["parameters"]
+        }
+        assert parameters["schema"] == "sales"
+        assert parameters["t0"] == "orders"
+        mock_client.tables.get.assert_not_called()
+
+    def test_bulk_groups_by_catalog_and_schema(self, detector, mock_client):
+        """Test that tables in different schemas are queried separately."""
+        mock_client.statement_execution.execute_statement.side_effect = [
+            self._statement_response([["t1", "id", "INT"], ["t1", "name", "STRING"]]),
+            self._statement_response([["t2", "price", "DOUBLE"]]),
+        ]
+
+        result = detector.get_table_schemas(["cat.s1.t1", "cat.s2.t2"])
+
+        assert result == {"cat.s1.t1": [("id", "INT"), ("name", "STRING")], "cat.s2.t2": [("price", "DOUBLE")]}
+        assert mock_client.statement_execution.execute_statement.call_count == 2
+
+    def test_bulk_follows_result_chunks(self, detector, mock_client):
+        """Test that rows spread over several result chunks are all collected."""
+        mock_client.statement_execution.execute_statement.return_value = _Response(
+            statement_id="stmt-1",
+            status=_Status(state=StatementState.SUCCEEDED),
+            result=_Inner(data_array=[["t1", "id", "INT"]], next_chunk_index=1),
+        )
+        mock_client.statement_execution.get_statement_result_chunk_n.return_value = _Inner(
+            data_array=[["t1", "name", "STRING"]], next_chunk_index=None
+        )
+
+        result = detector.get_table_schemas(["cat.s.t1"])
+
+        assert result == {"cat.s.t1": [("id", "INT"), ("name", "STRING")]}
+        mock_client.statement_execution.get_statement_result_chunk_n.assert_called_once_with("stmt-1", 1)
+
+    def test_chunked_result_without_statement_id_falls_back_to_sdk(self, detector, mock_client, id_long_columns):
+        """Test that further result chunks without a statement id to fetch them fall back to SDK lookups."""
+        mock_client.statement_execution.execute_statement.return_value = _Response(
+            statement_id=None,
+            status=_Status(state=StatementState.SUCCEEDED),
+            result=_Inner(data_array=[["t1", "id", "INT"]], next_chunk_index=1),
+        )
+        mock_client.tables.get.return_value = SimpleNamespace(columns=id_long_columns)
+
+        result = detector.get_table_schemas(["cat.s.t1"])
+
+        assert result == {"cat.s.t1": [("id", "LONG")]}
+        mock_client.statement_execution.get_statement_result_chunk_n.assert_not_called()
+
+    def test_missing_rows_fall_back_to_sdk(self, detector, mock_client, id_long_columns):
+        """Test that tables absent from the bulk result are fetched individually."""
+        mock_client.statement_execution.execute_statement.return_value = self._statement_response(
+            [["t1", "id", "BIGINT"]]
+        )
+        mock_client.tables.get.return_value = SimpleNamespace(columns=id_long_columns)
+
+        result = detector.get_table_schemas(["cat.s.t1", "cat.s.t2"])
+
+        assert result == {"cat.s.t1": [("id", "LONG")], "cat.s.t2": [("id", "LONG")]}
+        mock_client.tables.get.assert_called_once_with("cat.s.t2")
+
+    def test_query_failure_falls_back_to_sdk(self, detector, mock_client, id_long_columns):
+        """Test that a failed bulk statement falls back to per-table SDK lookups."""
+        mock_client.statement_execution.execute_statement.side_effect = Exception("warehouse unavailable")
+        mock_client.tables.get.return_value = SimpleNamespace(columns=id_long_columns)
+
+        result = detector.get_table_schemas(["cat.s.t1", "cat.s.t2"])
+
+        assert result == {"cat.s.t1": [("id", "LONG")], "cat.s.t2": [("id", "LONG")]}
+        assert mock_client.tables.get.call_count == 2
+
+    def test_no_warehouse_uses_sdk(self, mock_client, id_long_columns, monkeypatch):
+        """Test that bulk detection is skipped entirely without a warehouse."""
+        monkeypatch.delenv("DATABRICKS_WAREHOUSE_ID", raising=False)
+        detector = SchemaDetector(mock_client)
+        mock_client.tables.get.return_value = SimpleNamespace(columns=id_long_columns)
+
+        result = detector.get_table_schemas(["cat.s.t1"])
+
+        assert result == {"cat.s.t1": [("id", "LONG")]}
+        mock_client.statement_execution.execute_statement.assert_not_called()
+
+    def test_bulk_reuses_cached_schemas(self, detector, mock_client):
+        """Test that tables already cached are not re-queried."""
+        mock_client.statement_execution.execute_statement.return_value = self._statement_response([["t1", "id", "INT"]])
+
+        detector.get_table_schemas(["cat.s.t1"])
+        result = detector.get_table_schemas(["cat.s.t1"])
+
+        assert result == {"cat.s.t1": [("id", "INT")]}
+        mock_client.statement_execution.execute_statement.assert_called_once()
+
+    def test_returned_schemas_do_not_alias_cache(self, detector, mock_client):
+        """Test that mutating a returned schema leaves the cached copy intact."""
+        mock_client.statement_execution.execute_statement.return_value = self._statement_response([["t1", "id", "INT"]])
+
+        detector.get_table_schemas(["cat.s.t1"])["cat.s.t1"].append(("extra", "STRING"))
+        detector.get_table_schema("cat.s.t1").clear()
+
+        assert detector.get_table_schemas(["cat.s.t1"]) == {"cat.s.t1": [("id", "INT")]}
+        assert detector.get_table_schema("cat.s.t1") == [("id", "INT")]
@@ -1,9 +1,38 @@
 """Configuration loader for clustering validation settings."""
 
+import threading
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml  # type: ignore[import-untyped]
+
+@lru_cache(maxsize=8)
+def _load_yaml(path: Path) -> dict[str, Any]:
+    """Read and parse a YAML config file, sharing the result across loader instances.
+
+    Args:
+        path: Resolved path to the YAML file (used as the cache key)
+
+    Returns:
+        Parsed configuration dictionary (empty if the file is empty)
+
+    Raises:
+        FileNotFoundError: If the file does not exist (failures are not cached, so it is retried next call)
+    """
+    import yaml  # type: ignore[import-untyped]  # imported on first parse, not at module import
+
+    # C parser when PyYAML was built against libyaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    try:
+        # Binary handle: the loader decodes UTF-8 itself, skipping the TextIOWrapper layer
+        f = path.open("rb")
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Configuration file not found: {path}") from e
+
+    with f:
+        loaded_config = yaml.load(f, Loader=loader)
+        return loaded_config if loaded_config is not None else {}
 
 
 class ClusteringConfigLoader:
@@ -25,13 +54,11 @@ class ClusteringConfigLoader:
         self._config: dict[str, Any] | None = None
 
     def _load_config(self) -> dict[str, Any]:
-        """Load configuration from YAML file."""
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
+        """Load configuration from YAML file.
 
-        with self.config_path.open(encoding="utf-8") as f:
-            loaded_config = yaml.safe_load(f)
-            return loaded_config if loaded_config is not None else {}
+        The existence check lives in the cached _load_yaml, so only the first load of a path touches the disk.
+        """
+        return _load_yaml(self.config_path.resolve())
 
     @property
     def config(self) -> dict[str, Any]:
@@ -40,140 +67,254 @@ class ClusteringConfigLoader:
             self._config = self._load_config()
         return self._config
 
-    def get_clustering_detection_config(self) -> dict[str, Any]:
-        """Get clustering detection configuration."""
+    # Configuration sections (resolved once per loader)
+
+    @cached_property
+    def clustering_detection_config(self) -> dict[str, Any]:
+        """Clustering detection configuration section."""
         result = self.config.get("clustering_detection", {})
         return result if isinstance(result, dict) else {}
 
-    def get_clustering_validation_config(self) -> dict[str, Any]:
-        """Get clustering validation configuration."""
+    @cached_property
+    def clustering_validation_config(self) -> dict[str, Any]:
+        """Clustering validation configuration section."""
         result = self.config.get("clustering_validation", {})
         return result if isinstance(result, dict) else {}
 
+    @cached_property
+    def auto_clustering_detection_config(self) -> dict[str, Any]:
+        """Auto-clustering detection configuration section."""
+        result = self.config.get("auto_clustering_detection", {})
+        return result if isinstance(result, dict) else {}
+
+    @cached_property
+    def delta_auto_optimization_config(self) -> dict[str, Any]:
+        """Delta auto-optimization configuration section."""
+        result = self.config.get("delta_auto_optimization", {})
+        return result if isinstance(result, dict) else {}
+
+    @cached_property
+    def exemptions_config(self) -> dict[str, Any]:
+        """Clustering exemptions configuration section."""
+        result = self.config.get("exemptions", {})
+        return result if isinstance(result, dict) else {}
+
+    @cached_property
+    def validation_messages(self) -> dict[str, str]:
+        """Validation messages with all keys and values converted to strings."""
+        result = self.config.get("validation_messages", {})
+        if isinstance(result, dict):
+            return {str(k): str(v) for k, v in result.items()}
+        return {}
+
+    # Coerced configuration values (computed once per loader)
+
+    @cached_property
+    def clustering_property_name(self) -> str:
+        """Property name for clustering columns."""
+        return str(self.clustering_detection_config.get("clustering_property_name", "clusteringColumns"))
+
+    @cached_property
+    def max_clustering_columns(self) -> int:
+        """Maximum recommended clustering columns."""
+        return int(self.clustering_detection_config.get("max_clustering_columns", 4))
+
+    @cached_property
+    def require_explicit_clustering(self) -> bool:
+        """Whether explicit clustering is required."""
+        return bool(self.clustering_detection_config.get("require_explicit_clustering", False))
+
+    @cached_property
+    def allow_empty_clustering(self) -> bool:
+        """Whether tables without clustering are allowed."""
+        return bool(self.clustering_validation_config.get("allow_empty_clustering", True))
+
+    @cached_property
+    def validate_column_limits(self) -> bool:
+        """Whether to validate clustering column limits."""
+        return bool(self.clustering_validation_config.get("validate_column_limits", True))
+
+    @cached_property
+    def cluster_by_auto_property(self) -> str:
+        """Property name for the clusterByAuto flag."""
+        return str(self.auto_clustering_detection_config.get("cluster_by_auto_property", "clusterByAuto"))
+
+    @cached_property
+    def cluster_by_auto_value(self) -> str:
+        """Expected value for clusterByAuto when enabled."""
+        return str(self.auto_clustering_detection_config.get("cluster_by_auto_value", "true"))
+
+    @cached_property
+    def require_cluster_by_auto(self) -> bool:
+        """Whether automatic clustering is required."""
+        return bool(self.auto_clustering_detection_config.get("require_cluster_by_auto", False))
+
+    @cached_property
+    def optimize_write_property(self) -> str:
+        """Property name for the optimizeWrite flag."""
+        return str(
+            self.delta_auto_optimization_config.get("optimize_write_property", "delta.autoOptimize.optimizeWrite")
+        )
+
+    @cached_property
+    def optimize_write_value(self) -> str:
+        """Expected value for optimizeWrite when enabled."""
+        return str(self.delta_auto_optimization_config.get("optimize_write_value", "true"))
+
+    @cached_property
+    def auto_compact_property(self) -> str:
+        """Property name for the autoCompact flag."""
+        return str(self.delta_auto_optimization_config.get("auto_compact_property", "delta.autoOptimize.autoCompact"))
+
+    @cached_property
+    def auto_compact_value(self) -> str:
+        """Expected value for autoCompact when enabled."""
+        return str(self.delta_auto_optimization_config.get("auto_compact_value", "true"))
+
+    @cached_property
+    def require_both_delta_flags(self) -> bool:
+        """Whether both optimizeWrite and autoCompact are required."""
+        return bool(self.delta_auto_optimization_config.get("require_both_flags", True))
+
+    @cached_property
+    def honor_exclusion_flag(self) -> bool:
+        """Whether to honor the cluster_exclusion property."""
+        return bool(self.exemptions_config.get("honor_exclusion_flag", True))
+
+    @cached_property
+    def exclusion_property_name(self) -> str:
+        """Property name for clustering exclusions."""
+        return str(self.exemptions_config.get("exclusion_property_name", "cluster_exclusion"))
+
+    @cached_property
+    def size_threshold_bytes(self) -> int:
+        """Size threshold for clustering requirements in bytes (1GB default)."""
+        return int(self.exemptions_config.get("size_threshold_bytes", 1073741824))
+
+    @cached_property
+    def test_size_threshold_bytes(self) -> int:
+        """Size threshold for integration testing in bytes (1MB default)."""
+        return int(self.exemptions_config.get("test_size_threshold_bytes", 1048576))
+
+    @cached_property
+    def exempt_small_tables(self) -> bool:
+        """Whether small tables are automatically exempt from clustering."""
+        return bool(self.exemptions_config.get("exempt_small_tables", True))
+
+    # Getter API (kept for existing callers; values come from the cached attributes above)
+
+    def get_clustering_detection_config(self) -> dict[str, Any]:
+        """Get clustering detection configuration."""
+        return self.clustering_detection_config
+
+    def get_clustering_validation_config(self) -> dict[str, Any]:
+        """Get clustering validation configuration."""
+        return self.clustering_validation_config
+
     def get_clustering_property_name(self) -> str:
         """Get the property name for clustering columns."""
-        result = self.get_clustering_detection_config().get("clustering_property_name", "clusteringColumns")
-        return str(result)
+        return self.clustering_property_name
 
     def get_max_clustering_columns(self) -> int:
         """Get maximum recommended clustering columns."""
-        result = self.get_clustering_detection_config().get("max_clustering_columns", 4)
-        return int(result)
+        return self.max_clustering_columns
 
     def get_require_explicit_clustering(self) -> bool:
         """Get whether explicit clustering is required."""
-        result = self.get_clustering_detection_config().get("require_explicit_clustering", False)
-        return bool(result)
+        return self.require_explicit_clustering
 
     def get_allow_empty_clustering(self) -> bool:
         """Get whether tables without clustering are allowed."""
-        result = self.get_clustering_validation_config().get("allow_empty_clustering", True)
-        return bool(result)
+        return self.allow_empty_clustering
 
     def get_validate_column_limits(self) -> bool:
         """Get whether to validate clustering column limits."""
-        result = self.get_clustering_validation_config().get("validate_column_limits", True)
-        return bool(result)
+        return self.validate_column_limits
 
     def get_validation_messages(self) -> dict[str, str]:
         """Get validation messages configuration."""
-        result = self.config.get("validation_messages", {})
-        if isinstance(result, dict):
-            # Convert all values to strings
-            return {str(k): str(v) for k, v in result.items()}
-        return {}
+        return self.validation_messages
 
     def get_auto_clustering_detection_config(self) -> dict[str, Any]:
         """Get auto-clustering detection configuration."""
-        result = self.config.get("auto_clustering_detection", {})
-        return result if isinstance(result, dict) else {}
+        return self.auto_clustering_detection_config
 
     def get_cluster_by_auto_property(self) -> str:
         """Get the property name for clusterByAuto flag."""
-        result = self.get_auto_clustering_detection_config().get("cluster_by_auto_property", "clusterByAuto")
-        return str(result)
+        return self.cluster_by_auto_property
 
     def get_cluster_by_auto_value(self) -> str:
         """Get the expected value for clusterByAuto when enabled."""
-        result = self.get_auto_clustering_detection_config().get("cluster_by_auto_value", "true")
-        return str(result)
+        return self.cluster_by_auto_value
 
     def get_require_cluster_by_auto(self) -> bool:
         """Get whether automatic clustering is required."""
-        result = self.get_auto_clustering_detection_config().get("require_cluster_by_auto", False)
-        return bool(result)
+        return self.require_cluster_by_auto
 
     def get_delta_auto_optimization_config(self) -> dict[str, Any]:
         """Get delta auto-optimization configuration."""
-        result = self.config.get("delta_auto_optimization", {})
-        return result if isinstance(result, dict) else {}
+        return self.delta_auto_optimization_config
 
     def get_optimize_write_property(self) -> str:
         """Get the property name for optimizeWrite flag."""
-        result = self.get_delta_auto_optimization_config().get(
-            "optimize_write_property", "delta.autoOptimize.optimizeWrite"
-        )
-        return str(result)
+        return self.optimize_write_property
 
     def get_optimize_write_value(self) -> str:
         """Get the expected value for optimizeWrite when enabled."""
-        result = self.get_delta_auto_optimization_config().get("optimize_write_value", "true")
-        return str(result)
+        return self.optimize_write_value
 
     def get_auto_compact_property(self) -> str:
         """Get the property name for autoCompact flag."""
-        result = self.get_delta_auto_optimization_config().get(
-            "auto_compact_property", "delta.autoOptimize.autoCompact"
-        )
-        return str(result)
+        return self.auto_compact_property
 
     def get_auto_compact_value(self) -> str:
         """Get the expected value for autoCompact when enabled."""
-        result = self.get_delta_auto_optimization_config().get("auto_compact_value", "true")
-        return str(result)
+        return self.auto_compact_value
 
     def get_require_both_delta_flags(self) -> bool:
         """Get whether both optimizeWrite and autoCompact are required."""
-        result = self.get_delta_auto_optimization_config().get("require_both_flags", True)
-        return bool(result)
+        return self.require_both_delta_flags
 
     def get_exemptions_config(self) -> dict[str, Any]:
         """Get clustering exemptions configuration."""
-        result = self.config.get("exemptions", {})
-        return result if isinstance(result, dict) else {}
+        return self.exemptions_config
 
     def get_honor_exclusion_flag(self) -> bool:
         """Get whether to honor cluster_exclusion property."""
-        result = self.get_exemptions_config().get("honor_exclusion_flag", True)
-        return bool(result)
+        return self.honor_exclusion_flag
 
     def get_exclusion_property_name(self) -> str:
         """Get the property name for clustering exclusions."""
-        result = self.get_exemptions_config().get("exclusion_property_name", "cluster_exclusion")
-        return str(result)
+        return self.exclusion_property_name
 
     def get_size_threshold_bytes(self) -> int:
         """Get size threshold for clustering requirements in bytes."""
-        result = self.get_exemptions_config().get("size_threshold_bytes", 1073741824)  # 1GB default
-        return int(result)
+        return self.size_threshold_bytes
 
     def get_test_size_threshold_bytes(self) -> int:
         """Get size threshold for integration testing in bytes."""
-        result = self.get_exemptions_config().get("test_size_threshold_bytes", 1048576)  # 1MB default
-        return int(result)
+        return self.test_size_threshold_bytes
 
     def get_exempt_small_tables(self) -> bool:
         """Get whether small tables are automatically exempt from clustering."""
-        result = self.get_exemptions_config().get("exempt_small_tables", True)
-        return bool(result)
+        return self.exempt_small_tables
 
 
 _singleton_instance: ClusteringConfigLoader | None = None
+_singleton_lock = threading.Lock()
 
 
 def get_clustering_config_loader() -> ClusteringConfigLoader:
-    """Get a singleton instance of ClusteringConfigLoader."""
+    """Get a singleton instance of ClusteringConfigLoader.
+
+    Uses double-checked locking so concurrent callers share one instance, and
+    loads the YAML under the lock so it is parsed exactly once.
+    """
     global _singleton_instance
     if _singleton_instance is None:
-        _singleton_instance = ClusteringConfigLoader()
+        with _singleton_lock:
+            if _singleton_instance is None:
+                loader = ClusteringConfigLoader()
+                loader.config  # noqa: B018 - warm the config before publishing the instance
+                _singleton_instance = loader
     return _singleton_instance
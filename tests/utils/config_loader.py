@@ -1,9 +1,73 @@
 """Configuration loader for documentation validation settings."""
 
+import re
+from collections.abc import Callable
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml  # type: ignore[import-untyped]
+
+@lru_cache(maxsize=32)
+def _parse_yaml(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a YAML config file, memoized on path and modification time.
+
+    Including mtime_ns in the key means an edited file is re-parsed while unchanged files are
+    parsed once per process. The returned dict is shared between loaders and must be treated as read-only.
+
+    Args:
+        path_str: Path to the YAML file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+
+    Returns:
+        Parsed configuration dictionary
+    """
+    # Deferred so importing the loader module (e.g. at test collection) does not pay for yaml
+    import yaml  # type: ignore[import-untyped]
+
+    # libyaml-backed parser when available
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    # Binary handle: the loader decodes UTF-8 itself, skipping the TextIOWrapper layer
+    with Path(path_str).open("rb") as f:
+        config = yaml.load(f, Loader=loader)
+
+    if not isinstance(config, dict):
+        raise ValueError(f"Configuration file must contain a YAML dictionary: {path_str}")
+
+    return config
+
+
+def _patterns_from_list(patterns: list[Any], patterns_key: str) -> list[str]:
+    """Handle a section that is a list of pattern objects or simple strings."""
+    if patterns and isinstance(patterns[0], dict):
+        return [p.get("pattern", "") for p in patterns if "pattern" in p]
+    # Simple list of strings
+    return [str(p) for p in patterns]
+
+
+def _patterns_from_dict(patterns: dict[str, Any], patterns_key: str) -> list[str]:
+    """Handle a section with patterns nested under patterns_key."""
+    nested_patterns = patterns.get(patterns_key, [])
+    return [str(p) for p in nested_patterns] if isinstance(nested_patterns, list) else []
+
+
+# Section shapes get_patterns_from_section understands, keyed by the parsed YAML type
+_PATTERN_HANDLERS: dict[type, Callable[[Any, str], list[str]]] = {
+    list: _patterns_from_list,
+    dict: _patterns_from_dict,
+}
+
+
+def _combine_critical_patterns(
+    compiled_patterns: tuple[tuple[re.Pattern[str], dict[str, Any]], ...],
+) -> re.Pattern[str]:
+    """OR compiled critical patterns into one regex, keeping each branch's case sensitivity via a scoped flag."""
+    branches = [
+        f"(?:{regex.pattern})" if pattern_info["case_sensitive"] else f"(?i:{regex.pattern})"
+        for regex, pattern_info in compiled_patterns
+    ]
+    # An empty alternation would match everything, so fall back to a pattern that never matches
+    return re.compile("|".join(branches) or "(?!)")
 
 
 class ConfigLoader:
@@ -23,19 +87,16 @@ class ConfigLoader:
             self.config_path = Path(config_path)
 
         self._config: dict[str, Any] | None = None
+        self._threshold_cache: dict[tuple[str, int | float, type], int | float] = {}
 
     def _load_config(self) -> dict[str, Any]:
-        """Load configuration from YAML file."""
-        if not self.config_path.exists():
-            raise FileNotFoundError(f"Configuration file not found: {self.config_path}")
-
-        with self.config_path.open(encoding="utf-8") as f:
-            config = yaml.safe_load(f)
+        """Load configuration from YAML file, reusing the parse while the file is unchanged."""
+        try:
+            mtime_ns = self.config_path.stat().st_mtime_ns
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {self.config_path}") from e
 
-        if not isinstance(config, dict):
-            raise ValueError(f"Configuration file must contain a YAML dictionary: {self.config_path}")
-
-        return config
+        return _parse_yaml(str(self.config_path), mtime_ns)
 
     @property
     def config(self) -> dict[str, Any]:
@@ -58,30 +119,19 @@ class ConfigLoader:
     def get_patterns_from_section(self, section_name: str, patterns_key: str = "patterns") -> list[str]:
         """Extract patterns from a configuration section, handling both dict and list formats."""
         patterns = self.get_config_section(section_name, [])
+        handler = _PATTERN_HANDLERS.get(type(patterns))
+        return handler(patterns, patterns_key) if handler else []
 
-        if isinstance(patterns, list):
-            # Handle list of pattern objects or simple strings
-            if patterns and isinstance(patterns[0], dict):
-                return [p.get("pattern", "") for p in patterns if "pattern" in p]
-            # Simple list of strings
-            return [str(p) for p in patterns]
-        if isinstance(patterns, dict):
-            # Patterns nested under a key in the section
-            nested_patterns = patterns.get(patterns_key, [])
-            return [str(p) for p in nested_patterns] if isinstance(nested_patterns, list) else []
-
-        return []
+    # Derived configuration values (computed once per loader)
 
-    def get_critical_column_patterns(self) -> list[str]:
-        """Get list of critical column patterns (backward compatibility)."""
+    @cached_property
+    def critical_column_patterns(self) -> list[str]:
+        """Critical column pattern strings."""
         return self.get_patterns_from_section("critical_column_patterns")
 
-    def get_critical_column_patterns_with_boundaries(self) -> list[dict[str, Any]]:
-        """Get critical column patterns with word boundary settings.
-
-        Returns:
-            List of pattern dictionaries with 'pattern', 'word_boundary', etc.
-        """
+    @cached_property
+    def critical_column_patterns_with_boundaries(self) -> list[dict[str, Any]]:
+        """Critical column pattern dictionaries with word boundary defaults applied."""
         patterns_config = self.get_config_section("critical_column_patterns", [])
         if not isinstance(patterns_config, list):
             return []
@@ -100,38 +150,154 @@ class ConfigLoader:
 
         return result
 
-    def get_validation_threshold(self, threshold_name: str, default_value: int | float = 0) -> int | float:
-        """Get a validation threshold by name."""
-        value = self.get_config_value("validation_thresholds", threshold_name, default_value)
-        return int(value) if isinstance(default_value, int) else float(value)
+    @cached_property
+    def compiled_critical_patterns(self) -> tuple[tuple[re.Pattern[str], dict[str, Any]], ...]:
+        """Critical column patterns compiled once, paired with their pattern dictionaries.
 
-    def get_placeholder_patterns(self) -> list[str]:
-        """Get placeholder detection patterns."""
+        Word-boundary patterns match the whole name, a "pattern_" prefix, a "_pattern_" infix or a
+        "pattern" suffix (covering snake_case and camelCase such as "userId"); others match as substrings.
+        """
+        compiled = []
+        for pattern_info in self.critical_column_patterns_with_boundaries:
+            escaped = re.escape(str(pattern_info["pattern"]))
+            regex = rf"^{escaped}_|_{escaped}_|{escaped}$" if pattern_info["word_boundary"] else escaped
+            flags = 0 if pattern_info["case_sensitive"] else re.IGNORECASE
+            compiled.append((re.compile(regex, flags), pattern_info))
+        return tuple(compiled)
+
+    @cached_property
+    def critical_column_regex(self) -> re.Pattern[str]:
+        """All critical column patterns combined into one alternation, so a column name needs a single search.
+
+        With no patterns configured the regex never matches.
+        """
+        return _combine_critical_patterns(self.compiled_critical_patterns)
+
+    @cached_property
+    def critical_substring_terms(self) -> tuple[str, ...]:
+        """Lowercased terms of the case-insensitive substring patterns (the ones plain string search can handle)."""
+        return tuple(
+            str(pattern_info["pattern"]).lower()
+            for _, pattern_info in self.compiled_critical_patterns
+            if not pattern_info["word_boundary"] and not pattern_info["case_sensitive"]
+        )
+
+    @cached_property
+    def critical_non_substring_regex(self) -> re.Pattern[str]:
+        """Combined regex of the critical patterns not covered by critical_substring_terms."""
+        return _combine_critical_patterns(
+            tuple(
+                (regex, pattern_info)
+                for regex, pattern_info in self.compiled_critical_patterns
+                if pattern_info["word_boundary"] or pattern_info["case_sensitive"]
+            )
+        )
+
+    @cached_property
+    def placeholder_patterns(self) -> list[str]:
+        """Placeholder detection pattern strings."""
         return self.get_patterns_from_section("placeholder_detection", "patterns")
 
-    def get_placeholder_detection_config(self) -> dict[str, Any]:
-        """Get complete placeholder detection configuration."""
+    @cached_property
+    def placeholder_detection_config(self) -> dict[str, Any]:
+        """Complete placeholder detection configuration."""
         config = self.get_config_section("placeholder_detection")
         return dict(config) if isinstance(config, dict) else {}
 
-    def get_comment_validation_config(self) -> dict[str, Any]:
-        """Get comment validation configuration."""
+    @cached_property
+    def compiled_placeholder_patterns(self) -> tuple[re.Pattern[str], ...]:
+        """Placeholder patterns compiled to match a whole comment or a leading "PATTERN:" prefix."""
+        flags = 0 if self.placeholder_detection_config.get("case_sensitive", False) else re.IGNORECASE
+        return tuple(re.compile(rf"^\s*(?:{pattern})\s*(?::|$)", flags) for pattern in self.placeholder_patterns)
+
+    @cached_property
+    def placeholder_regex(self) -> re.Pattern[str]:
+        """All placeholder patterns in one anchored alternation (never matches when none are configured)."""
+        if not self.placeholder_patterns:
+            return re.compile("(?!)")
+        flags = 0 if self.placeholder_detection_config.get("case_sensitive", False) else re.IGNORECASE
+        alternatives = "|".join(f"(?:{pattern})" for pattern in self.placeholder_patterns)
+        return re.compile(rf"^\s*(?:{alternatives})\s*(?::|$)", flags)
+
+    @cached_property
+    def comment_validation_config(self) -> dict[str, Any]:
+        """Comment validation configuration."""
         config = self.get_config_section("comment_validation")
         return dict(config) if isinstance(config, dict) else {}
 
-    def get_comprehensive_rules(self) -> dict[str, Any]:
-        """Get comprehensive documentation rules configuration."""
+    @cached_property
+    def comprehensive_rules(self) -> dict[str, Any]:
+        """Comprehensive documentation rules configuration."""
         config = self.get_config_section("comprehensive_rules")
         return dict(config) if isinstance(config, dict) else {}
 
+    # Getter API (kept for existing callers; values come from the cached attributes above)
+
+    def get_critical_column_patterns(self) -> list[str]:
+        """Get list of critical column patterns (backward compatibility)."""
+        return self.critical_column_patterns
+
+    def get_critical_column_patterns_with_boundaries(self) -> list[dict[str, Any]]:
+        """Get critical column patterns with word boundary settings.
+
+        Returns:
+            List of pattern dictionaries with 'pattern', 'word_boundary', etc.
+        """
+        return self.critical_column_patterns_with_boundaries
+
+    def get_compiled_critical_patterns(self) -> tuple[tuple[re.Pattern[str], dict[str, Any]], ...]:
+        """Get critical column patterns as compiled regexes with their pattern dictionaries."""
+        return self.compiled_critical_patterns
+
+    def get_critical_column_regex(self) -> re.Pattern[str]:
+        """Get all critical column patterns as a single compiled regex."""
+        return self.critical_column_regex
 
-# Global config loader instance
-_config_loader: ConfigLoader | None = None
+    def get_critical_substring_terms(self) -> tuple[str, ...]:
+        """Get the lowercased terms of case-insensitive substring critical patterns."""
+        return self.critical_substring_terms
+
+    def get_critical_non_substring_regex(self) -> re.Pattern[str]:
+        """Get the combined regex of critical patterns that are not plain case-insensitive substrings."""
+        return self.critical_non_substring_regex
+
+    def get_validation_threshold(self, threshold_name: str, default_value: int | float = 0) -> int | float:
+        """Get a validation threshold by name.
+
+        Results are cached per (name, default, default type) since 80 and 80.0 hash equal but coerce differently.
+        """
+        key = (threshold_name, default_value, type(default_value))
+        if key not in self._threshold_cache:
+            value = self.get_config_value("validation_thresholds", threshold_name, default_value)
+            self._threshold_cache[key] = int(value) if isinstance(default_value, int) else float(value)
+        return self._threshold_cache[key]
+
+    def get_placeholder_patterns(self) -> list[str]:
+        """Get placeholder detection patterns."""
+        return self.placeholder_patterns
+
+    def get_compiled_placeholder_patterns(self) -> tuple[re.Pattern[str], ...]:
+        """Get placeholder patterns as compiled regexes."""
+        return self.compiled_placeholder_patterns
+
+    def get_placeholder_regex(self) -> re.Pattern[str]:
+        """Get all placeholder patterns as a single compiled regex."""
+        return self.placeholder_regex
+
+    def get_placeholder_detection_config(self) -> dict[str, Any]:
+        """Get complete placeholder detection configuration."""
+        return self.placeholder_detection_config
+
+    def get_comment_validation_config(self) -> dict[str, Any]:
+        """Get comment validation configuration."""
+        return self.comment_validation_config
+
+    def get_comprehensive_rules(self) -> dict[str, Any]:
+        """Get comprehensive documentation rules configuration."""
+        return self.comprehensive_rules
 
 
+@cache
 def get_config_loader() -> ConfigLoader:
     """Get singleton configuration loader instance."""
-    global _config_loader
-    if _config_loader is None:
-        _config_loader = ConfigLoader()
-    return _config_loader
+    return ConfigLoader()
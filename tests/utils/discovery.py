@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, NamedTuple
+from dataclasses import dataclass, field, replace
+from typing import Any
 
 
-class ColumnInfo(NamedTuple):
+@dataclass(frozen=True, slots=True)
+class ColumnInfo:
     """Immutable column information based on Databricks SDK structure.
 
     Based on databricks.sdk.service.catalog.ColumnInfo research:
@@ -18,8 +20,13 @@ class ColumnInfo(NamedTuple):
     type_text: str
     comment: str | None = None
 
+    def _replace(self, **changes: Any) -> ColumnInfo:
+        """Return a copy with the given fields replaced (NamedTuple-compatible API)."""
+        return replace(self, **changes)
 
-class TableInfo(NamedTuple):
+
+@dataclass(frozen=True, slots=True)
+class TableInfo:
     """Immutable table information based on Databricks SDK structure.
 
     Based on databricks.sdk.service.catalog.TableInfo research:
@@ -35,11 +42,15 @@ class TableInfo(NamedTuple):
     comment: str | None = None
     columns: tuple[ColumnInfo, ...] = ()
     properties: dict[str, Any] | None = None
+    # Fully qualified table name, built once since reports and validators read it per check
+    full_name: str = field(init=False, repr=False, compare=False)
 
-    @property
-    def full_name(self) -> str:
-        """Fully qualified table name."""
-        return f"{self.catalog}.{self.schema}.{self.table}"
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "full_name", f"{self.catalog}.{self.schema}.{self.table}")
+
+    def _replace(self, **changes: Any) -> TableInfo:
+        """Return a copy with the given fields replaced (NamedTuple-compatible API)."""
+        return replace(self, **changes)
 
     @property
     def is_test_table(self) -> bool:
@@ -52,4 +63,7 @@ class TableInfo(NamedTuple):
         Based on SDK research: comments are either str or None.
         We treat None and empty/whitespace strings as "no comment".
         """
-        return bool(self.comment and self.comment.strip())
+        comment = self.comment
+        if not comment:
+            return False
+        return not comment.isspace()
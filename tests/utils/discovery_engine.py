@@ -7,16 +7,86 @@ and production use (all accessible catalogs).
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from collections.abc import Iterator
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import islice
+from sys import intern
+from typing import TYPE_CHECKING
 
-from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.catalog import TableInfo as SdkTableInfo
+from tests.utils.discovery import ColumnInfo, TableInfo
 
-from tests.utils.discovery import TableInfo
+if TYPE_CHECKING:
+    # Annotation-only; the client is passed in, so importing the SDK here would only slow module import
+    from databricks.sdk import WorkspaceClient
+    from databricks.sdk.service.catalog import TableInfo as SdkTableInfo
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent Unity Catalog listing calls, kept low to stay under API rate limits
+MAX_DISCOVERY_WORKERS = 16
+
+# Catalogs skipped in production discovery unless include_system_catalogs is set
+_SYSTEM_CATALOGS = frozenset({"system", "information_schema"})
+
+
+class _TableBudget:
+    """Thread-safe max_total_tables budget shared by all listing workers.
+
+    Tables are counted as delivered once fetched and as in flight while a worker is fetching one.
+    Only delivered plus in-flight tables count against the limit, and a worker or catalog is turned
+    away only once in-flight fetches can no longer free room; until then callers wait for them to settle.
+    """
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._delivered = 0
+        self._in_flight = 0
+        self._closed = False
+        self._changed = threading.Condition()
+
+    def spent(self) -> bool:
+        """Whether the limit is reached for good, waiting for in-flight fetches that could still free room."""
+        with self._changed:
+            while not self._closed and self._in_flight and self._delivered + self._in_flight >= self._limit:
+                self._changed.wait()
+            return self._closed or self._delivered >= self._limit
+
+    def claim(self) -> bool:
+        """Reserve one table before fetching it; False once the budget is spent or closed."""
+        with self._changed:
+            while not self._closed:
+                if self._delivered + self._in_flight < self._limit:
+                    self._in_flight += 1
+                    return True
+                if not self._in_flight:
+                    return False
+                self._changed.wait()
+            return False
+
+    def settle(self, fetched: bool) -> None:
+        """Finish a claimed fetch, counting the table as delivered if one was returned."""
+        with self._changed:
+            self._in_flight -= 1
+            if fetched:
+                self._delivered += 1
+            self._changed.notify_all()
+
+    def release(self, count: int) -> None:
+        """Return delivered tables that were dropped because their schema listing failed."""
+        with self._changed:
+            self._delivered -= count
+            self._changed.notify_all()
+
+    def close(self) -> None:
+        """Stop all further claims, e.g. when the consumer stops reading early."""
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
 
 @dataclass
 class DiscoveryConfig:
@@ -49,27 +119,90 @@ class DatabricksDiscovery:
         Returns:
             List of discovered tables as TableInfo objects
         """
+        return list(self.iter_tables())
+
+    def iter_tables(self) -> Iterator[TableInfo]:
+        """Discover tables based on configuration, yielding them as each catalog's listing completes.
+
+        Lets callers start validating the first catalog while later catalogs are still being listed.
+        All schema and table listings share one pool of MAX_DISCOVERY_WORKERS threads; this generator
+        only schedules work and never blocks a pool thread on another listing.
+
+        Workers reserve each table from a shared max_total_tables budget before fetching it, so at most
+        that many SDK tables are pulled overall, and the cap is reached whenever enough tables exist. Output stays in catalog then schema order, but when the
+        cap is hit, which tables make the cut depends on which listings got to them first.
+
+        Yields:
+            Discovered tables as TableInfo objects
+        """
         logger.info(f"Starting table discovery with config: {self.config}")
 
-        discovered_tables = []
+        total_tables = 0
+        catalogs = self._get_target_catalogs()
+        if not catalogs:
+            logger.info("Discovery complete: 0 total tables")
+            return
 
-        for catalog_name in self._get_target_catalogs():
-            try:
-                catalog_tables = list(self._discover_catalog_tables(catalog_name))
-                discovered_tables.extend(catalog_tables)
-                logger.info(f"Discovered {len(catalog_tables)} tables in catalog '{catalog_name}'")
+        max_total = self.config.max_total_tables
+        budget = _TableBudget(max_total)
+        executor = ThreadPoolExecutor(max_workers=MAX_DISCOVERY_WORKERS)
+        try:
+            schema_futures = [executor.submit(self._list_catalog_schemas, catalog_name) for catalog_name in catalogs]
+            table_jobs: dict[int, list[tuple[str, Future[list[SdkTableInfo]]]]] = {}
+
+            def schedule_catalog(index: int) -> None:
+                """Queue the table listings of catalog `index` once its schema names are known."""
+                catalog_name = catalogs[index]
+                if budget.spent():
+                    # Nothing left to fetch; skip the catalog without waiting on its schemas
+                    schema_futures[index].cancel()
+                    table_jobs[index] = []
+                    return
+                try:
+                    schema_names = schema_futures[index].result()
+                except Exception as e:
+                    logger.error(f"Failed to list schemas in catalog '{catalog_name}': {e}")
+                    table_jobs[index] = []
+                    return
+                table_jobs[index] = [
+                    (schema_name, executor.submit(self._list_schema_tables, catalog_name, schema_name, budget))
+                    for schema_name in schema_names
+                ]
+
+            # Yield in catalog then schema order so results stay deterministic regardless of completion order
+            for index, catalog_name in enumerate(catalogs):
+                if index not in table_jobs:
+                    schedule_catalog(index)
+                # Queue later catalogs whose schemas already arrived, so the pool stays busy while we wait
+                for later in range(index + 1, len(catalogs)):
+                    if later not in table_jobs and schema_futures[later].done():
+                        schedule_catalog(later)
+
+                catalog_tables = 0
+                for schema_name, future in table_jobs.pop(index):
+                    try:
+                        sdk_tables = future.result()
+                    except Exception as e:
+                        logger.warning(f"Failed to list tables in {catalog_name}.{schema_name}: {e}")
+                        continue
+
+                    for table in sdk_tables:
+                        # Convert SDK TableInfo to our TableInfo
+                        yield self._convert_sdk_table(table, catalog_name, schema_name)
+                    catalog_tables += len(sdk_tables)
 
-                # Safety limit check
-                if len(discovered_tables) >= self.config.max_total_tables:
-                    logger.warning(f"Reached max_total_tables limit ({self.config.max_total_tables})")
-                    break
+                total_tables += catalog_tables
+                logger.info(f"Discovered {catalog_tables} tables in catalog '{catalog_name}'")
 
-            except Exception as e:
-                logger.warning(f"Failed to discover tables in catalog '{catalog_name}': {e}")
-                continue
+            # Safety limit check
+            if total_tables >= max_total:
+                logger.warning(f"Reached max_total_tables limit ({max_total})")
+        finally:
+            # Stop running listings at their next table and don't start any nobody will read
+            budget.close()
+            executor.shutdown(wait=True, cancel_futures=True)
 
-        logger.info(f"Discovery complete: {len(discovered_tables)} total tables")
-        return discovered_tables
+        logger.info(f"Discovery complete: {total_tables} total tables")
 
     def _get_target_catalogs(self) -> list[str]:
         """Get list of catalogs to search.
@@ -92,7 +225,7 @@ class DatabricksDiscovery:
                     continue
 
                 # Skip system catalogs unless explicitly included
-                if not self.config.include_system_catalogs and catalog_name in {"system", "information_schema"}:
+                if not self.config.include_system_catalogs and catalog_name in _SYSTEM_CATALOGS:
                     logger.debug(f"Skipping system catalog: {catalog_name}")
                     continue
 
@@ -106,48 +239,77 @@ class DatabricksDiscovery:
         logger.info(f"Discovered {len(discovered_catalogs)} accessible catalogs")
         return discovered_catalogs
 
-    def _discover_catalog_tables(self, catalog_name: str) -> Iterator[TableInfo]:
-        """Discover tables in a specific catalog.
+    def _list_catalog_schemas(self, catalog_name: str) -> list[str]:
+        """List the schema names to search in one catalog (runs on a discovery worker thread).
 
         Args:
             catalog_name: Name of catalog to search
 
-        Yields:
-            TableInfo objects for each discovered table
+        Returns:
+            Schema names in listing order, filtered by target_schemas when configured
         """
-        try:
-            # Get schemas in catalog
-            schemas = list(self.client.schemas.list(catalog_name=catalog_name))
-            logger.debug(f"Found {len(schemas)} schemas in catalog '{catalog_name}'")
+        schemas = list(self.client.schemas.list(catalog_name=catalog_name))
+        logger.debug(f"Found {len(schemas)} schemas in catalog '{catalog_name}'")
 
-            for schema in schemas:
-                schema_name = schema.name
-                if schema_name is None:
-                    continue
+        schema_names = []
+        for schema in schemas:
+            schema_name = schema.name
+            if schema_name is None:
+                continue
 
-                # Filter schemas if configured
-                if self.config.target_schemas and schema_name not in self.config.target_schemas:
-                    logger.debug(f"Skipping schema '{schema_name}' (not in target list)")
-                    continue
+            # Filter schemas if configured
+            if self.config.target_schemas and schema_name not in self.config.target_schemas:
+                logger.debug(f"Skipping schema '{schema_name}' (not in target list)")
+                continue
 
-                try:
-                    tables_list = list(self.client.tables.list(catalog_name=catalog_name, schema_name=schema_name))
-                    for schema_tables, table in enumerate(tables_list, 1):
-                        # Convert SDK TableInfo to our TableInfo
-                        table_info = self._convert_sdk_table(table, catalog_name, schema_name)
-                        yield table_info
+            schema_names.append(schema_name)
 
-                        if schema_tables >= self.config.max_tables_per_schema:
-                            logger.warning(f"Reached max_tables_per_schema limit in {catalog_name}.{schema_name}")
-                            break
+        return schema_names
 
-                except Exception as e:
-                    logger.warning(f"Failed to list tables in {catalog_name}.{schema_name}: {e}")
-                    continue
+    def _list_schema_tables(
+        self, catalog_name: str, schema_name: str, budget: _TableBudget | None = None
+    ) -> list[SdkTableInfo]:
+        """List the SDK tables in one schema (runs on a discovery worker thread).
 
-        except Exception as e:
-            logger.error(f"Failed to list schemas in catalog '{catalog_name}': {e}")
-            return
+        The SDK paginates lazily, so stopping at max_tables_per_schema, or once the shared budget
+        is spent, avoids fetching pages past the cap.
+
+        Args:
+            catalog_name: Catalog name
+            schema_name: Schema name
+            budget: Shared total-table budget; one table is claimed before each fetch (None = unbounded)
+
+        Returns:
+            Up to max_tables_per_schema SDK table infos for the schema
+        """
+        limit = self.config.max_tables_per_schema
+        tables_iter = self.client.tables.list(catalog_name=catalog_name, schema_name=schema_name)
+        if budget is None:
+            tables = list(islice(tables_iter, limit))
+        else:
+            tables = []
+            tables_iter = iter(tables_iter)
+            try:
+                while len(tables) < limit and budget.claim():
+                    try:
+                        table = next(tables_iter, None)
+                    except Exception:
+                        budget.settle(fetched=False)
+                        raise
+                    # An exhausted schema settles its claim empty, handing the room back to the other listings
+                    budget.settle(fetched=table is not None)
+                    if table is None:
+                        break
+                    tables.append(table)
+            except Exception:
+                # The failed listing's tables are dropped, so they no longer count against the cap
+                budget.release(len(tables))
+                raise
+
+        if len(tables) >= limit:
+            logger.warning(f"Reached max_tables_per_schema limit in {catalog_name}.{schema_name}")
+
+        return tables
 
     def _convert_sdk_table(self, sdk_table: SdkTableInfo, catalog_name: str, schema_name: str) -> TableInfo:
         """Convert SDK TableInfo to our TableInfo.
@@ -160,22 +322,25 @@ class DatabricksDiscovery:
         Returns:
             Our TableInfo object
         """
-        # Extract column information if available
-        from tests.utils.discovery import ColumnInfo
-
-        columns: tuple[ColumnInfo, ...] = ()
-        if sdk_table.columns:
-            columns = tuple(
-                ColumnInfo(name=col.name or "unknown", type_text=col.type_text or "unknown", comment=col.comment)
-                for col in sdk_table.columns
+        # Extract column information if available (positional construction in a single pass).
+        # Column names and types recur across most tables of a catalog, so all tables share one interned copy.
+        sdk_columns = sdk_table.columns
+        columns: tuple[ColumnInfo, ...] = (
+            tuple(
+                [
+                    ColumnInfo(intern(col.name or "unknown"), intern(col.type_text or "unknown"), col.comment)
+                    for col in sdk_columns
+                ]
             )
+            if sdk_columns
+            else ()
+        )
 
         table_name = sdk_table.name or "unknown"
 
         # Extract properties if available (needed for clustering detection)
-        properties = None
-        if hasattr(sdk_table, "properties") and sdk_table.properties:
-            properties = dict(sdk_table.properties)
+        sdk_properties = getattr(sdk_table, "properties", None)
+        properties = dict(sdk_properties) if sdk_properties else None
 
         return TableInfo(
             catalog=catalog_name,
@@ -211,29 +376,34 @@ def create_integration_discovery(
     return DatabricksDiscovery(client, config)
 
 
-def create_production_discovery(client: WorkspaceClient) -> DatabricksDiscovery:
-    """Create discovery engine configured for production use.
+# Environment variables read by create_production_discovery, in _parse_production_config argument order
+_PRODUCTION_ENV_KEYS = (
+    "DISCOVERY_TARGET_CATALOGS",
+    "DISCOVERY_TARGET_SCHEMAS",
+    "DISCOVERY_MAX_TABLES",
+    "DISCOVERY_MAX_PER_SCHEMA",
+    "DISCOVERY_INCLUDE_SYSTEM",
+)
 
-    Uses environment variables for configuration:
-    - DISCOVERY_TARGET_CATALOGS: Comma-separated list (e.g., "workspace,samples")
-    - DISCOVERY_TARGET_SCHEMAS: Comma-separated list (e.g., "pytest_test_data,information_schema")
-    - DISCOVERY_MAX_TABLES: Maximum total tables to discover (default: 5000)
-    - DISCOVERY_MAX_PER_SCHEMA: Maximum tables per schema (default: 1000)
+
+@lru_cache(maxsize=8)
+def _parse_production_config(env_snapshot: tuple[str | None, ...]) -> DiscoveryConfig:
+    """Parse DISCOVERY_* environment values into a DiscoveryConfig, memoized on the raw values.
+
+    The returned config is the cached template for that environment; create_production_discovery
+    hands each engine its own copy, so callers never see the template itself.
 
     Args:
-        client: Databricks workspace client
+        env_snapshot: Values of _PRODUCTION_ENV_KEYS (None when unset)
 
     Returns:
-        Discovery engine configured for production
+        Production discovery configuration
     """
-    import os
+    target_catalogs_env, target_schemas_env, max_tables_env, max_per_schema_env, include_system_env = env_snapshot
 
-    # Get configuration from environment variables
-    target_catalogs_env = os.getenv("DISCOVERY_TARGET_CATALOGS")
-    target_schemas_env = os.getenv("DISCOVERY_TARGET_SCHEMAS")
-    max_tables = int(os.getenv("DISCOVERY_MAX_TABLES", "5000"))
-    max_per_schema = int(os.getenv("DISCOVERY_MAX_PER_SCHEMA", "1000"))
-    include_system = os.getenv("DISCOVERY_INCLUDE_SYSTEM", "false").lower() == "true"
+    max_tables = int(max_tables_env if max_tables_env is not None else "5000")
+    max_per_schema = int(max_per_schema_env if max_per_schema_env is not None else "1000")
+    include_system = (include_system_env or "false").lower() == "true"
 
     # Parse comma-separated lists
     target_catalogs = None
@@ -265,4 +435,31 @@ def create_production_discovery(client: WorkspaceClient) -> DatabricksDiscovery:
 
     logger.info(f"Discovery limits: {max_per_schema} per schema, {max_tables} total")
 
+    return config
+
+
+def create_production_discovery(client: WorkspaceClient) -> DatabricksDiscovery:
+    """Create discovery engine configured for production use.
+
+    Uses environment variables for configuration:
+    - DISCOVERY_TARGET_CATALOGS: Comma-separated list (e.g., "workspace,samples")
+    - DISCOVERY_TARGET_SCHEMAS: Comma-separated list (e.g., "pytest_test_data,information_schema")
+    - DISCOVERY_MAX_TABLES: Maximum total tables to discover (default: 5000)
+    - DISCOVERY_MAX_PER_SCHEMA: Maximum tables per schema (default: 1000)
+
+    Args:
+        client: Databricks workspace client
+
+    Returns:
+        Discovery engine configured for production
+    """
+    # Only the raw values are snapshotted per call; parsing and logging happen once per distinct environment
+    env_snapshot = tuple(os.getenv(key) for key in _PRODUCTION_ENV_KEYS)
+    template = _parse_production_config(env_snapshot)
+    # Copy the template, including its lists, so changes to one engine's config never reach the cache
+    config = replace(
+        template,
+        target_catalogs=list(template.target_catalogs) if template.target_catalogs is not None else None,
+        target_schemas=list(template.target_schemas) if template.target_schemas is not None else None,
+    )
     return DatabricksDiscovery(client, config)
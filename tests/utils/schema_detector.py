@@ -9,11 +9,31 @@ See: research/clustering/small_tables_auto_exemption/DATABRICKS_SDK_SCHEMA_DETEC
 from __future__ import annotations
 
 import logging
+import os
+from typing import TYPE_CHECKING
 
 from databricks.sdk import WorkspaceClient
+from databricks.sdk.service.sql import StatementParameterListItem, StatementState
+
+if TYPE_CHECKING:
+    from tests.utils.discovery import TableInfo
 
 logger = logging.getLogger(__name__)
 
+# Maximum table names per information_schema IN (...) list, keeping statements well under size limits
+BULK_QUERY_CHUNK_SIZE = 200
+
+# Bulk column lookup; catalog, schema and table names are bound as parameters (the catalog-qualified view via IDENTIFIER)
+_INFORMATION_SCHEMA_COLUMNS_SQL = (
+    "SELECT table_name, column_name, data_type "
+    "FROM IDENTIFIER(:columns_view) "
+    "WHERE table_schema = :schema AND table_name IN ({table_markers}) "
+    "ORDER BY table_name, ordinal_position"
+)
+
+# information_schema reports SQL type names; map the ones that differ from ColumnTypeName values
+_SQL_TYPE_TO_COLUMN_TYPE_NAME = {"BIGINT": "LONG", "SMALLINT": "SHORT", "TINYINT": "BYTE"}
+
 
 class SchemaDetectionError(Exception):
     """Raised when schema cannot be determined using any available method."""
@@ -31,17 +51,34 @@ class SchemaDetector:
     - Type-safe enum responses
     """
 
-    def __init__(self, client: WorkspaceClient):
+    def __init__(self, client: WorkspaceClient, warehouse_id: str | None = None):
         """Initialize schema detector.
 
         Args:
             client: Databricks workspace client
+            warehouse_id: SQL warehouse for bulk schema queries. Defaults to DATABRICKS_WAREHOUSE_ID.
         """
         self.client = client
+        self.warehouse_id = warehouse_id or os.getenv("DATABRICKS_WAREHOUSE_ID")
+        self._cache: dict[str, list[tuple[str, str]]] = {}
+
+    def invalidate(self, table_name: str | None = None) -> None:
+        """Drop cached schemas after DDL changes.
+
+        Args:
+            table_name: Full table name to drop, or None to clear the whole cache
+        """
+        if table_name is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(table_name, None)
 
     def get_table_schema(self, table_name: str) -> list[tuple[str, str]]:
         """Get table schema using native Databricks SDK.
 
+        Schemas are cached per fully-qualified name and each call returns a fresh list, so callers may
+        modify the result; call invalidate() after altering a table.
+
         Args:
             table_name: Full table name (catalog.schema.table)
 
@@ -51,6 +88,9 @@ class SchemaDetector:
         Raises:
             SchemaDetectionError: If schema cannot be determined
         """
+        if table_name in self._cache:
+            return list(self._cache[table_name])
+
         logger.debug(f"Getting schema for {table_name} using native SDK")
 
         try:
@@ -65,7 +105,145 @@ class SchemaDetector:
                 col_type = col.type_name.value if col.type_name else "unknown"
                 columns.append((col_name, col_type))
             logger.debug(f"Retrieved schema for {table_name}: {len(columns)} columns")
-            return columns
+            self._cache[table_name] = columns
+            return list(columns)
 
         except Exception as e:
             raise SchemaDetectionError(f"Could not determine schema for {table_name}: {e}") from e
+
+    @staticmethod
+    def schema_from_table_info(table_info: TableInfo) -> list[tuple[str, str]]:
+        """Build a schema from columns already fetched by table discovery, without an API call.
+
+        Callers holding a discovered TableInfo should prefer this over get_table_schema(),
+        which remains the fallback when only a table name is known.
+
+        Args:
+            table_info: Discovered table with columns populated
+
+        Returns:
+            List of (column_name, column_type) tuples in the same type vocabulary as get_table_schema()
+
+        Raises:
+            SchemaDetectionError: If the table has no column metadata
+        """
+        if not table_info.columns:
+            raise SchemaDetectionError(f"Table {table_info.full_name} has no columns metadata")
+
+        return [(col.name, _normalize_type_name(col.type_text)) for col in table_info.columns]
+
+    def get_table_schemas(self, table_names: list[str]) -> dict[str, list[tuple[str, str]]]:
+        """Get schemas for many tables using one information_schema query per catalog.schema.
+
+        Cached schemas are reused; the remaining tables are grouped by catalog.schema and
+        queried in chunks of BULK_QUERY_CHUNK_SIZE.
+        Any table the bulk path cannot resolve (no warehouse, query failure, missing rows)
+        falls back to get_table_schema().
+
+        Args:
+            table_names: Full table names (catalog.schema.table)
+
+        Returns:
+            Mapping of full table name to list of (column_name, column_type) tuples
+
+        Raises:
+            SchemaDetectionError: If a table's schema cannot be determined by either path
+        """
+        # Results get their own lists so callers cannot alter the cached schemas
+        schemas = {name: list(self._cache[name]) for name in table_names if name in self._cache}
+
+        if self.warehouse_id:
+            grouped: dict[tuple[str, str], list[str]] = {}
+            for table_name in table_names:
+                parts = table_name.split(".")
+                if table_name not in schemas and len(parts) == 3:
+                    grouped.setdefault((parts[0], parts[1]), []).append(table_name)
+
+            for (catalog, schema), names in grouped.items():
+                for start in range(0, len(names), BULK_QUERY_CHUNK_SIZE):
+                    chunk = names[start : start + BULK_QUERY_CHUNK_SIZE]
+                    try:
+                        resolved = self._query_information_schema(self.warehouse_id, catalog, schema, chunk)
+                        self._cache.update(resolved)
+                        schemas.update((name, list(columns)) for name, columns in resolved.items())
+                    except Exception as e:
+                        logger.warning(f"Bulk schema query failed for {catalog}.{schema}: {e}")
+
+        # Fall back to per-table SDK lookups for anything the bulk path did not resolve
+        for table_name in table_names:
+            if table_name not in schemas:
+                schemas[table_name] = self.get_table_schema(table_name)
+
+        return schemas
+
+    def _query_information_schema(
+        self, warehouse_id: str, catalog: str, schema: str, table_names: list[str]
+    ) -> dict[str, list[tuple[str, str]]]:
+        """Fetch column schemas for tables in one catalog.schema with a single statement.
+
+        Args:
+            warehouse_id: SQL warehouse to run the statement on
+            catalog: Catalog name
+            schema: Schema name
+            table_names: Full table names in this catalog.schema
+
+        Returns:
+            Mapping of full table name to (column_name, column_type) tuples for tables with rows
+        """
+        # information_schema stores schema and table names lowercased, so mixed-case names must be folded to match
+        names_by_table = {name.split(".")[2].lower(): name for name in table_names}
+
+        # Values travel as bound parameters; only the marker count varies, so full chunks share one statement text
+        parameters = [
+            StatementParameterListItem(
+                name="columns_view", value=f"{_quote_identifier(catalog)}.information_schema.columns"
+            ),
+            StatementParameterListItem(name="schema", value=schema.lower()),
+        ]
+        parameters.extend(
+            StatementParameterListItem(name=f"t{i}", value=table) for i, table in enumerate(names_by_table)
+        )
+
+        response = self.client.statement_execution.execute_statement(
+            statement=_INFORMATION_SCHEMA_COLUMNS_SQL.format(
+                table_markers=", ".join(f":t{i}" for i in range(len(names_by_table)))
+            ),
+            warehouse_id=warehouse_id,
+            parameters=parameters,
+            wait_timeout="30s",
+        )
+        if response.status and response.status.state != StatementState.SUCCEEDED:
+            raise SchemaDetectionError(f"information_schema query ended in state {response.status.state}")
+
+        rows = list(response.result.data_array or []) if response.result else []
+        next_chunk = response.result.next_chunk_index if response.result else None
+        if next_chunk is not None:
+            statement_id = response.statement_id
+            if statement_id is None:
+                raise SchemaDetectionError("information_schema query returned more chunks but no statement id")
+            while next_chunk is not None:
+                chunk = self.client.statement_execution.get_statement_result_chunk_n(statement_id, next_chunk)
+                rows.extend(chunk.data_array or [])
+                next_chunk = chunk.next_chunk_index
+
+        schemas: dict[str, list[tuple[str, str]]] = {}
+        for table, col_name, data_type in rows:
+            full_name = names_by_table.get(str(table).lower())
+            if full_name is None:
+                continue
+            col_type = _normalize_type_name(str(data_type)) if data_type else "unknown"
+            schemas.setdefault(full_name, []).append((col_name or "unknown", col_type))
+
+        logger.debug(f"Bulk schema query for {catalog}.{schema}: {len(schemas)}/{len(table_names)} tables resolved")
+        return schemas
+
+
+def _normalize_type_name(type_text: str) -> str:
+    """Map a SQL type string (e.g. "bigint", "decimal(10,2)", "array<string>") to its ColumnTypeName value."""
+    base_type = type_text.split("(", 1)[0].split("<", 1)[0].strip().upper()
+    return _SQL_TYPE_TO_COLUMN_TYPE_NAME.get(base_type, base_type)
+
+
+def _quote_identifier(identifier: str) -> str:
+    """Quote a SQL identifier with backticks."""
+    return "`" + identifier.replace("`", "``") + "`"
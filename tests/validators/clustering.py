@@ -2,14 +2,24 @@
 
 from __future__ import annotations
 
-import json
 import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+from functools import lru_cache
+from sys import intern
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from databricks.sdk import WorkspaceClient
 
 from tests.utils.clustering_config_loader import get_clustering_config_loader
 
+try:
+    # orjson's C parser when installed (pip install .[speedups]); its JSONDecodeError subclasses ValueError
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from tests.utils.discovery import TableInfo
 
@@ -18,6 +28,117 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@lru_cache(maxsize=4096)
+def _parse_clustering_json(clustering_raw: str) -> list[list[str]]:
+    """Parse a clusteringColumns JSON string, memoized on the raw text.
+
+    Every has_*/get_*/count_* check on a table re-reads the same property string, and tables often share
+    identical clustering specs, so each distinct string is parsed once. The returned list is shared
+    between callers and must not be mutated.
+
+    Args:
+        clustering_raw: JSON string from the table's clustering property
+
+    Returns:
+        Parsed clustering groups, or an empty list if the JSON is invalid or not a list
+    """
+    try:
+        result = _json_loads(clustering_raw)
+    except (ValueError, TypeError):
+        return []
+    return _clustering_groups(result) if isinstance(result, list) else []
+
+
+def _clustering_groups(clustering_data: list[Any]) -> list[list[str]]:
+    """Keep only the list-shaped groups of parsed clustering data.
+
+    Validating here means callers can index groups without re-checking their type.
+    Well-formed data (the usual case) is returned as-is without copying.
+    """
+    if all(isinstance(group, list) for group in clustering_data):
+        return clustering_data
+    return [group for group in clustering_data if isinstance(group, list)]
+
+
+@dataclass(frozen=True)
+class _ClusteringSettings:
+    """Clustering configuration values resolved once per process and shared by all validators."""
+
+    clustering_property_name: str
+    require_explicit_clustering: bool
+    max_clustering_columns: int
+    allow_empty_clustering: bool
+    cluster_by_auto_property: str
+    cluster_by_auto_value: str
+    require_cluster_by_auto: bool
+    optimize_write_property: str
+    optimize_write_value: str
+    auto_compact_property: str
+    auto_compact_value: str
+    require_both_delta_flags: bool
+    honor_exclusion_flag: bool
+    exclusion_property_name: str
+    size_threshold_bytes: int
+    test_size_threshold_bytes: int
+    exempt_small_tables: bool
+    cluster_by_auto_value_lc: str
+    optimize_write_value_lc: str
+    auto_compact_value_lc: str
+
+
+@lru_cache(maxsize=1)
+def _clustering_settings() -> _ClusteringSettings:
+    """Resolve clustering settings from the shared config loader (first call only)."""
+    loader = get_clustering_config_loader()
+    # Property names and expected values are looked up and compared per table, so share one interned copy of each
+    return _ClusteringSettings(
+        clustering_property_name=intern(loader.get_clustering_property_name()),
+        require_explicit_clustering=loader.get_require_explicit_clustering(),
+        max_clustering_columns=loader.get_max_clustering_columns(),
+        allow_empty_clustering=loader.get_allow_empty_clustering(),
+        cluster_by_auto_property=intern(loader.get_cluster_by_auto_property()),
+        cluster_by_auto_value=loader.get_cluster_by_auto_value(),
+        require_cluster_by_auto=loader.get_require_cluster_by_auto(),
+        optimize_write_property=intern(loader.get_optimize_write_property()),
+        optimize_write_value=loader.get_optimize_write_value(),
+        auto_compact_property=intern(loader.get_auto_compact_property()),
+        auto_compact_value=loader.get_auto_compact_value(),
+        require_both_delta_flags=loader.get_require_both_delta_flags(),
+        honor_exclusion_flag=loader.get_honor_exclusion_flag(),
+        exclusion_property_name=intern(loader.get_exclusion_property_name()),
+        size_threshold_bytes=loader.get_size_threshold_bytes(),
+        test_size_threshold_bytes=loader.get_test_size_threshold_bytes(),
+        exempt_small_tables=loader.get_exempt_small_tables(),
+        cluster_by_auto_value_lc=intern(str(loader.get_cluster_by_auto_value()).lower()),
+        optimize_write_value_lc=intern(str(loader.get_optimize_write_value()).lower()),
+        auto_compact_value_lc=intern(str(loader.get_auto_compact_value()).lower()),
+    )
+
+
+# Shared stand-in for tables without properties; read-only so no caller can populate it
+_EMPTY_PROPERTIES: Mapping[str, Any] = MappingProxyType({})
+
+
+def _props(table: TableInfo) -> Mapping[str, Any]:
+    """Return the table's properties, or an empty mapping when they are missing."""
+    return table.properties or _EMPTY_PROPERTIES
+
+
+def _flag_matches(properties: Mapping[str, Any], property_name: str, expected_lc: str) -> bool:
+    """Check whether a table property is set to the expected value, ignoring case.
+
+    Args:
+        properties: Table properties dict
+        property_name: Property to read
+        expected_lc: Expected value, already lowercased
+
+    Returns:
+        True if the property is present, non-empty and matches expected_lc
+    """
+    value = properties.get(property_name)
+    return bool(value) and str(value).lower() == expected_lc
+
+
 class ClusteringValidator:
     """Validator for clustering compliance of Databricks tables.
 
@@ -31,31 +152,68 @@ class ClusteringValidator:
     def __init__(self) -> None:
         """Initialize validator with configuration from YAML file."""
         self._config_loader = get_clustering_config_loader()
+        settings = _clustering_settings()
 
         # Load clustering configuration values from YAML
-        self.clustering_property_name = self._config_loader.get_clustering_property_name()
-        self.require_explicit_clustering = self._config_loader.get_require_explicit_clustering()
-        self.max_clustering_columns = self._config_loader.get_max_clustering_columns()
-        self.allow_empty_clustering = self._config_loader.get_allow_empty_clustering()
+        self.clustering_property_name = settings.clustering_property_name
+        self.require_explicit_clustering = settings.require_explicit_clustering
+        self.max_clustering_columns = settings.max_clustering_columns
+        self.allow_empty_clustering = settings.allow_empty_clustering
 
         # Load auto-clustering configuration values
-        self.cluster_by_auto_property = self._config_loader.get_cluster_by_auto_property()
-        self.cluster_by_auto_value = self._config_loader.get_cluster_by_auto_value()
-        self.require_cluster_by_auto = self._config_loader.get_require_cluster_by_auto()
+        self.cluster_by_auto_property = settings.cluster_by_auto_property
+        self.require_cluster_by_auto = settings.require_cluster_by_auto
 
         # Load delta auto-optimization configuration values
-        self.optimize_write_property = self._config_loader.get_optimize_write_property()
-        self.optimize_write_value = self._config_loader.get_optimize_write_value()
-        self.auto_compact_property = self._config_loader.get_auto_compact_property()
-        self.auto_compact_value = self._config_loader.get_auto_compact_value()
-        self.require_both_delta_flags = self._config_loader.get_require_both_delta_flags()
+        self.optimize_write_property = settings.optimize_write_property
+        self.auto_compact_property = settings.auto_compact_property
+        self.require_both_delta_flags = settings.require_both_delta_flags
 
         # Load exemption configuration values
-        self.honor_exclusion_flag = self._config_loader.get_honor_exclusion_flag()
-        self.exclusion_property_name = self._config_loader.get_exclusion_property_name()
-        self.size_threshold_bytes = self._config_loader.get_size_threshold_bytes()
-        self.test_size_threshold_bytes = self._config_loader.get_test_size_threshold_bytes()
-        self.exempt_small_tables = self._config_loader.get_exempt_small_tables()
+        self.honor_exclusion_flag = settings.honor_exclusion_flag
+        self.exclusion_property_name = settings.exclusion_property_name
+        self.size_threshold_bytes = settings.size_threshold_bytes
+        self.test_size_threshold_bytes = settings.test_size_threshold_bytes
+        self.exempt_small_tables = settings.exempt_small_tables
+
+        # Expected flag values are kept alongside a lowercased copy for the per-table comparisons;
+        # the public properties below keep the two in sync when a value is overridden
+        self._cluster_by_auto_value = settings.cluster_by_auto_value
+        self._cluster_by_auto_value_lc = settings.cluster_by_auto_value_lc
+        self._optimize_write_value = settings.optimize_write_value
+        self._optimize_write_value_lc = settings.optimize_write_value_lc
+        self._auto_compact_value = settings.auto_compact_value
+        self._auto_compact_value_lc = settings.auto_compact_value_lc
+
+    @property
+    def cluster_by_auto_value(self) -> str:
+        """Expected value of the auto-clustering property."""
+        return self._cluster_by_auto_value
+
+    @cluster_by_auto_value.setter
+    def cluster_by_auto_value(self, value: str) -> None:
+        self._cluster_by_auto_value = value
+        self._cluster_by_auto_value_lc = str(value).lower()
+
+    @property
+    def optimize_write_value(self) -> str:
+        """Expected value of the optimize-write property."""
+        return self._optimize_write_value
+
+    @optimize_write_value.setter
+    def optimize_write_value(self, value: str) -> None:
+        self._optimize_write_value = value
+        self._optimize_write_value_lc = str(value).lower()
+
+    @property
+    def auto_compact_value(self) -> str:
+        """Expected value of the auto-compact property."""
+        return self._auto_compact_value
+
+    @auto_compact_value.setter
+    def auto_compact_value(self, value: str) -> None:
+        self._auto_compact_value = value
+        self._auto_compact_value_lc = str(value).lower()
 
     def _parse_clustering_data(self, table: TableInfo) -> list[list[str]]:
         """Parse clustering data from table properties.
@@ -68,24 +226,17 @@ class ClusteringValidator:
         Returns:
             Parsed clustering data as nested list format [["col1"],["col2"]]
         """
-        if not table.properties:
-            return []
-
-        clustering_raw = table.properties.get(self.clustering_property_name)
+        clustering_raw = _props(table).get(self.clustering_property_name)
         if not clustering_raw:
             return []
 
         # Handle string format (JSON from Databricks)
         if isinstance(clustering_raw, str):
-            try:
-                result = json.loads(clustering_raw)
-                return result if isinstance(result, list) else []
-            except (json.JSONDecodeError, TypeError):
-                return []
+            return _parse_clustering_json(clustering_raw)
 
         # Handle list format (from unit tests)
-        elif isinstance(clustering_raw, list):
-            return clustering_raw
+        if isinstance(clustering_raw, list):
+            return _clustering_groups(clustering_raw)
 
         return []
 
@@ -118,17 +269,8 @@ class ClusteringValidator:
         Returns:
             list[str]: List of clustering column names, empty list if no clustering
         """
-        clustering_data = self._parse_clustering_data(table)
-        if not clustering_data:
-            return []
-
-        # Convert nested list format [["col1"],["col2"]] to flat list ["col1", "col2"]
-        column_names = []
-        for cluster_group in clustering_data:
-            if isinstance(cluster_group, list) and len(cluster_group) > 0:
-                column_names.append(cluster_group[0])  # Take first item from each group
-
-        return column_names
+        # Convert nested list format [["col1"],["col2"]] to flat list ["col1", "col2"] (first item of each group)
+        return [group[0] for group in self._parse_clustering_data(table) if group]
 
     def count_clustering_columns(self, table: TableInfo) -> int:
         """
@@ -140,7 +282,8 @@ class ClusteringValidator:
         Returns:
             int: Number of clustering columns (0 if no clustering)
         """
-        return len(self.get_clustering_columns(table))
+        # Same groups get_clustering_columns() keeps, counted without building the name list
+        return sum(1 for group in self._parse_clustering_data(table) if group)
 
     def validates_clustering_column_limits(self, table: TableInfo) -> bool:
         """
@@ -173,15 +316,7 @@ class ClusteringValidator:
         Returns:
             bool: True if table has automatic clustering enabled, False otherwise
         """
-        if table.properties is None:
-            return False
-
-        cluster_by_auto_value = table.properties.get(self.cluster_by_auto_property)
-        if not cluster_by_auto_value:
-            return False
-
-        # Handle string comparison (property values are typically strings)
-        return str(cluster_by_auto_value).lower() == str(self.cluster_by_auto_value).lower()
+        return self._has_auto_clustering_in(_props(table))
 
     def get_auto_clustering_status(self, table: TableInfo) -> str:
         """
@@ -202,7 +337,7 @@ class ClusteringValidator:
 
         if cluster_by_auto_value is None:
             return "disabled"  # Property missing = disabled
-        if str(cluster_by_auto_value).lower() == str(self.cluster_by_auto_value).lower():
+        if str(cluster_by_auto_value).lower() == self._cluster_by_auto_value_lc:
             return "enabled"
         return "disabled"
 
@@ -220,12 +355,31 @@ class ClusteringValidator:
         Returns:
             bool: True if table has explicit clustering OR automatic clustering, False otherwise
         """
+        properties = _props(table)
+        if not properties:
+            return False
+
+        # Cheapest first: flag lookups on the properties dict, then the JSON-backed clustering columns
         return (
-            self.has_clustering_columns(table)
-            or self.has_auto_clustering(table)
-            or self.has_delta_auto_optimization(table)
+            self._has_auto_clustering_in(properties)
+            or self._has_delta_auto_optimization_in(properties)
+            or self.has_clustering_columns(table)
         )
 
+    def _has_auto_clustering_in(self, properties: Mapping[str, Any]) -> bool:
+        """Check the clusterByAuto flag in an already-dereferenced properties dict."""
+        # Handle string comparison (property values are typically strings)
+        return _flag_matches(properties, self.cluster_by_auto_property, self._cluster_by_auto_value_lc)
+
+    def _has_delta_auto_optimization_in(self, properties: Mapping[str, Any]) -> bool:
+        """Check the delta auto-optimization flags in an already-dereferenced properties dict."""
+        has_optimize_write = _flag_matches(properties, self.optimize_write_property, self._optimize_write_value_lc)
+        if self.require_both_delta_flags and not has_optimize_write:
+            return False
+        if not self.require_both_delta_flags and has_optimize_write:
+            return True
+        return _flag_matches(properties, self.auto_compact_property, self._auto_compact_value_lc)
+
     def has_optimize_write(self, table: TableInfo) -> bool:
         """Check if table has optimizeWrite enabled.
 
@@ -235,14 +389,7 @@ class ClusteringValidator:
         Returns:
             bool: True if optimizeWrite is enabled, False otherwise
         """
-        if table.properties is None:
-            return False
-
-        optimize_write_value = table.properties.get(self.optimize_write_property)
-        if not optimize_write_value:
-            return False
-
-        return str(optimize_write_value).lower() == str(self.optimize_write_value).lower()
+        return _flag_matches(_props(table), self.optimize_write_property, self._optimize_write_value_lc)
 
     def has_auto_compact(self, table: TableInfo) -> bool:
         """Check if table has autoCompact enabled.
@@ -253,14 +400,7 @@ class ClusteringValidator:
         Returns:
             bool: True if autoCompact is enabled, False otherwise
         """
-        if table.properties is None:
-            return False
-
-        auto_compact_value = table.properties.get(self.auto_compact_property)
-        if not auto_compact_value:
-            return False
-
-        return str(auto_compact_value).lower() == str(self.auto_compact_value).lower()
+        return _flag_matches(_props(table), self.auto_compact_property, self._auto_compact_value_lc)
 
     def has_delta_auto_optimization(self, table: TableInfo) -> bool:
         """Check if table has delta auto-optimization enabled.
@@ -274,11 +414,8 @@ class ClusteringValidator:
         Returns:
             bool: True if delta auto-optimization is properly configured, False otherwise
         """
-        if self.require_both_delta_flags:
-            # Both optimizeWrite and autoCompact must be enabled
-            return self.has_optimize_write(table) and self.has_auto_compact(table)
-        # Either optimizeWrite or autoCompact is sufficient
-        return self.has_optimize_write(table) or self.has_auto_compact(table)
+        # require_both_flags: both optimizeWrite and autoCompact must be enabled, otherwise either is sufficient
+        return self._has_delta_auto_optimization_in(_props(table))
 
     def get_delta_auto_optimization_status(self, table: TableInfo) -> dict[str, Any]:
         """Get detailed delta auto-optimization status for a table.
@@ -289,9 +426,13 @@ class ClusteringValidator:
         Returns:
             dict: Status information including individual flag states and overall status
         """
-        has_optimize_write = self.has_optimize_write(table)
-        has_auto_compact = self.has_auto_compact(table)
-        has_delta_optimization = self.has_delta_auto_optimization(table)
+        properties = _props(table)
+        has_optimize_write = _flag_matches(properties, self.optimize_write_property, self._optimize_write_value_lc)
+        has_auto_compact = _flag_matches(properties, self.auto_compact_property, self._auto_compact_value_lc)
+        if self.require_both_delta_flags:
+            has_delta_optimization = has_optimize_write and has_auto_compact
+        else:
+            has_delta_optimization = has_optimize_write or has_auto_compact
 
         return {
             "has_optimize_write": has_optimize_write,
@@ -322,10 +463,7 @@ class ClusteringValidator:
         if not self.honor_exclusion_flag:
             return False
 
-        if table.properties is None:
-            return False
-
-        exclusion_value = table.properties.get(self.exclusion_property_name)
+        exclusion_value = _props(table).get(self.exclusion_property_name)
         if not exclusion_value:
             return False
 
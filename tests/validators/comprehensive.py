@@ -6,6 +6,10 @@ to be considered comprehensively compliant.
 """
 
 import logging
+import operator
+import re
+from collections import Counter
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -15,6 +19,26 @@ from tests.validators.documentation import DocumentationValidator
 
 logger = logging.getLogger(__name__)
 
+# Individual checks run for every table, in the order _run_individual_validators returns them
+CHECK_NAMES = (
+    "table_has_comment",
+    "table_comment_length",
+    "no_placeholder_comments",
+    "column_coverage_80",
+    "critical_columns_documented",
+)
+
+# Threshold checks such as "column_coverage >= 80": metric, comparison and numeric threshold
+_THRESHOLD_CHECK = re.compile(r"(\w+)\s*(>=|<=|>|<|==)\s*([\d.]+)")
+
+_COMPARISONS: dict[str, Callable[[float, float], bool]] = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+    "==": operator.eq,
+}
+
 
 @dataclass
 class ComprehensiveComplianceResult:
@@ -28,14 +52,12 @@ class ComprehensiveComplianceResult:
     @property
     def compliance_summary(self) -> str:
         """Human-readable compliance summary."""
-        passed_checks = [k for k, v in self.individual_results.items() if v]
         failed_checks = [k for k, v in self.individual_results.items() if not v]
+        if not failed_checks:
+            return "All checks passed"
 
-        return (
-            f"Passed: {len(passed_checks)}/{len(self.individual_results)} checks. " + f"Failed: {failed_checks}"
-            if failed_checks
-            else "All checks passed"
-        )
+        total_checks = len(self.individual_results)
+        return f"Passed: {total_checks - len(failed_checks)}/{total_checks} checks. Failed: {failed_checks}"
 
 
 class ComprehensiveDocumentationValidator:
@@ -59,99 +81,176 @@ class ComprehensiveDocumentationValidator:
                 "critical_columns_documented",
             ]
 
+        # Numeric table metrics that threshold checks can compare against
+        self._metrics: dict[str, Callable[[TableInfo], float]] = {
+            "column_coverage": self._doc_validator.calculate_column_documentation_percentage,
+        }
+
+        # Resolve each check string once so per-table evaluation does no parsing
+        self._compiled_checks = [(check, self._compile_check(check)) for check in self._required_checks]
+
         logger.info(f"Initialized comprehensive validator with {len(self._required_checks)} checks")
 
     def evaluate_table_compliance(self, table: TableInfo) -> ComprehensiveComplianceResult:
         """Evaluate comprehensive compliance for a single table."""
+        individual_values, failure_reasons = self._evaluate(table)
+        return self._build_result(table, individual_values, failure_reasons)
 
-        # Run all individual validators
-        individual_results = self._run_individual_validators(table)
+    def _evaluate(self, table: TableInfo) -> tuple[tuple[bool, ...], list[str]]:
+        """Run the individual validators and required checks without building a result object.
 
-        # Check all required rules
-        failure_reasons = []
-        overall_compliant = True
+        Returns:
+            Individual check results in CHECK_NAMES order, and the failure reasons (empty if compliant)
+        """
+        # Numeric metrics are measured once and shared by the individual validators and threshold checks
+        metrics = self._measure(table)
 
-        for check in self._required_checks:
-            if not self._evaluate_check(check, table, individual_results):
-                overall_compliant = False
-                failure_reasons.append(f"Failed: {check}")
+        # Run all individual validators
+        individual_values = self._run_individual_validators(table, metrics)
 
+        # Check all required rules
+        failure_reasons = [
+            f"Failed: {check}" for check, evaluate in self._compiled_checks if not evaluate(individual_values, metrics)
+        ]
+        return individual_values, failure_reasons
+
+    @staticmethod
+    def _build_result(
+        table: TableInfo, individual_values: tuple[bool, ...], failure_reasons: list[str]
+    ) -> ComprehensiveComplianceResult:
+        """Wrap evaluation output in a ComprehensiveComplianceResult."""
         return ComprehensiveComplianceResult(
             table=table,
-            overall_compliant=overall_compliant,
-            individual_results=individual_results,
+            overall_compliant=not failure_reasons,
+            individual_results=dict(zip(CHECK_NAMES, individual_values)),
             failure_reasons=failure_reasons,
         )
 
-    def _run_individual_validators(self, table: TableInfo) -> dict[str, bool]:
-        """Run all individual documentation validators."""
-        return {
-            "table_has_comment": self._doc_validator.has_comment(table),
-            "table_comment_length": self._doc_validator.has_minimum_length(table),
-            "no_placeholder_comments": not self._doc_validator.has_placeholder_comment(table),
-            "column_coverage_80": self._doc_validator.meets_column_documentation_threshold(table, 80.0),
-            "critical_columns_documented": self._doc_validator.has_all_critical_columns_documented(table),
-        }
+    def _measure(self, table: TableInfo) -> dict[str, float]:
+        """Compute every numeric table metric (e.g. column_coverage percentage) once."""
+        return {metric: measure(table) for metric, measure in self._metrics.items()}
 
-    def _evaluate_check(self, check: str, table: TableInfo, individual_results: dict[str, bool]) -> bool:
-        """Evaluate a single check."""
+    def _run_individual_validators(self, table: TableInfo, metrics: dict[str, float]) -> tuple[bool, ...]:
+        """Run all individual documentation validators.
+
+        Args:
+            table: Table to validate
+            metrics: Output of _measure for the same table
+
+        Returns:
+            One result per check, in CHECK_NAMES order
+        """
+        # The three table comment checks share one read of the comment
+        has_comment, meets_minimum_length, is_placeholder = self._doc_validator.analyze_comment(table)
+        return (
+            has_comment,
+            meets_minimum_length,
+            not is_placeholder,
+            metrics["column_coverage"] >= 80.0,
+            self._doc_validator.has_all_critical_columns_documented(table),
+        )
+
+    def _compile_check(self, check: str) -> Callable[[tuple[bool, ...], dict[str, float]], bool]:
+        """Turn a required check string into a callable of (individual_values, metrics).
+
+        Args:
+            check: Check name (e.g. "table_has_comment") or threshold expression (e.g. "column_coverage >= 80")
+
+        Returns:
+            Callable returning whether the table passes the check
+        """
         # Direct lookup for simple checks
-        if check in individual_results:
-            return individual_results[check]
+        if check in CHECK_NAMES:
+            index = CHECK_NAMES.index(check)
+            return lambda individual_values, metrics: individual_values[index]
 
         # Handle threshold checks like "column_coverage >= 80"
-        if ">=" in check:
-            metric, threshold_str = check.split(">=")
-            metric = metric.strip()
-            threshold = float(threshold_str.strip())
+        match = _THRESHOLD_CHECK.fullmatch(check.strip())
+        if match:
+            metric, comparison, threshold_str = match.groups()
+            threshold = float(threshold_str)
 
-            if metric == "column_coverage":
-                return self._doc_validator.meets_column_documentation_threshold(table, threshold)
+            # A threshold already computed as an individual check (e.g. column_coverage_80) is a plain lookup
+            canonical = f"{metric}_{threshold:g}"
+            if comparison == ">=" and canonical in CHECK_NAMES:
+                index = CHECK_NAMES.index(canonical)
+                return lambda individual_values, metrics: individual_values[index]
+
+            if metric in self._metrics:
+                compare = _COMPARISONS[comparison]
+                return lambda individual_values, metrics: compare(metrics[metric], threshold)
 
         logger.warning(f"Unknown check: {check}")
-        return False
+        return lambda individual_values, metrics: False
 
-    def evaluate_tables(self, tables: list[TableInfo]) -> tuple[list[ComprehensiveComplianceResult], dict[str, Any]]:
-        """Evaluate comprehensive compliance for multiple tables with summary."""
-        results = []
+    def evaluate_tables(
+        self, tables: list[TableInfo], detailed: bool = True
+    ) -> tuple[list[ComprehensiveComplianceResult], dict[str, Any]]:
+        """Evaluate comprehensive compliance for multiple tables with summary.
+
+        Args:
+            tables: Tables to evaluate
+            detailed: Build a ComprehensiveComplianceResult per table. Pass False when only the
+                summary is needed; the returned results list is then empty.
 
+        Returns:
+            Per-table results and the summary statistics
+        """
+        results = []
+        total_tables = len(tables)
+
+        # Single pass over the tables: compliance count, per-check passes and failure reasons
+        compliant_tables = 0
+        passed_counts = dict.fromkeys(CHECK_NAMES, 0)
+        failure_counts: Counter[str] = Counter()
+        # Every check reads only the table comment and columns, so tables sharing both share an outcome
+        seen: dict[tuple[Any, ...], tuple[tuple[bool, ...], list[str]]] = {}
         for table in tables:
-            result = self.evaluate_table_compliance(table)
-            results.append(result)
+            try:
+                key = (table.comment, table.columns)
+                cached = seen.get(key)
+            except TypeError:
+                # Unhashable columns (e.g. a list built by hand): evaluate without memoizing
+                key, cached = None, None
+
+            if cached is None:
+                individual_values, failure_reasons = self._evaluate(table)
+                if key is not None:
+                    seen[key] = (individual_values, failure_reasons)
+            else:
+                individual_values, failure_reasons = cached[0], list(cached[1])
+
+            if detailed:
+                results.append(self._build_result(table, individual_values, failure_reasons))
+
+            for check, ok in zip(CHECK_NAMES, individual_values):
+                if ok:
+                    passed_counts[check] += 1
+
+            if failure_reasons:
+                failure_counts.update(failure_reasons)
+            else:
+                compliant_tables += 1
 
         # Calculate summary statistics
-        total_tables = len(results)
-        compliant_tables = sum(1 for r in results if r.overall_compliant)
         compliance_rate = (compliant_tables / total_tables * 100) if total_tables > 0 else 0
 
         # Aggregate individual check statistics
         check_stats = {}
-        if results:
-            all_checks: set[str] = set()
-            for result in results:
-                all_checks.update(result.individual_results.keys())
-
-            for check in all_checks:
-                passed = sum(1 for r in results if r.individual_results.get(check, False))
+        if total_tables:
+            for check, passed in passed_counts.items():
                 check_stats[check] = {
                     "passed": passed,
                     "failed": total_tables - passed,
-                    "pass_rate": (passed / total_tables * 100) if total_tables > 0 else 0,
+                    "pass_rate": passed / total_tables * 100,
                 }
 
-        # Common failure reasons
-        failure_counts: dict[str, int] = {}
-        for result in results:
-            if not result.overall_compliant:
-                for reason in result.failure_reasons:
-                    failure_counts[reason] = failure_counts.get(reason, 0) + 1
-
         summary = {
             "total_tables": total_tables,
             "comprehensive_compliant": compliant_tables,
             "comprehensive_compliance_rate": compliance_rate,
             "individual_check_stats": check_stats,
-            "common_failures": failure_counts,
+            "common_failures": dict(failure_counts),
             "required_checks": self._required_checks,
         }
 
@@ -3,13 +3,127 @@
 from __future__ import annotations
 
 import re
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-from tests.utils.config_loader import get_config_loader
+from tests.utils.config_loader import ConfigLoader, get_config_loader
+
+try:
+    # Aho-Corasick automaton for substring critical patterns when installed (pip install .[speedups])
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # type: ignore[assignment]
 
 if TYPE_CHECKING:
     from tests.utils.discovery import TableInfo
 
+# Placeholder patterns made only of these characters match nothing but their own literal text
+_LITERAL_PLACEHOLDER = re.compile(r"[\w /'-]+")
+
+
+@dataclass(frozen=True, slots=True)
+class _ColumnScan:
+    """Documentation status of a table's columns, gathered in a single pass."""
+
+    documented_count: int
+    undocumented: tuple[str, ...]
+    undocumented_critical: tuple[str, ...]
+
+
+_EMPTY_SCAN = _ColumnScan(0, (), ())
+
+
+def _build_critical_matcher(loader: ConfigLoader) -> Callable[[str], bool]:
+    """Build the column-name predicate behind DocumentationValidator._is_column_critical().
+
+    Uses the combined critical regex, unless pyahocorasick is installed: then the case-insensitive
+    substring patterns are found by one automaton scan of the lowercased name and only the remaining
+    patterns go through the regex.
+
+    Args:
+        loader: Config loader providing the compiled critical patterns
+
+    Returns:
+        Callable taking a column name and returning whether it matches any critical pattern
+    """
+    substring_terms = loader.get_critical_substring_terms()
+    if ahocorasick is None or not substring_terms:
+        search = loader.get_critical_column_regex().search
+        return lambda column_name: search(column_name) is not None
+
+    automaton = ahocorasick.Automaton()
+    for term in substring_terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    find_substring = automaton.iter
+    search_rest = loader.get_critical_non_substring_regex().search
+
+    def is_critical_name(column_name: str) -> bool:
+        if next(find_substring(column_name.lower()), None) is not None:
+            return True
+        return search_rest(column_name) is not None
+
+    return is_critical_name
+
+
+@dataclass(frozen=True)
+class _DocumentationSettings:
+    """Documentation configuration and matchers resolved once per process and shared by all validators."""
+
+    minimum_comment_length: int
+    required_column_coverage_percent: float
+    critical_column_patterns: list[str]
+    placeholder_patterns: list[str]
+    placeholder_config: dict[str, Any]
+    comment_validation_config: dict[str, Any]
+    placeholder_case_sensitive: bool
+    placeholder_regex: re.Pattern[str]
+    placeholder_exact: frozenset[str]
+    placeholder_lengths: frozenset[int] | None
+    is_critical_name: Callable[[str], bool]
+
+
+@lru_cache(maxsize=1)
+def _documentation_settings() -> _DocumentationSettings:
+    """Resolve documentation settings from the shared config loader (first call only).
+
+    Tests that edit the config can call _documentation_settings.cache_clear() to rebuild it.
+    """
+    loader = get_config_loader()
+    placeholder_patterns = loader.get_placeholder_patterns()
+    placeholder_config = loader.get_placeholder_detection_config()
+    case_sensitive = bool(placeholder_config.get("case_sensitive", False))
+
+    return _DocumentationSettings(
+        minimum_comment_length=int(loader.get_validation_threshold("minimum_comment_length", 10)),
+        required_column_coverage_percent=float(loader.get_validation_threshold("required_column_coverage_percent", 80)),
+        critical_column_patterns=loader.get_critical_column_patterns(),
+        placeholder_patterns=placeholder_patterns,
+        placeholder_config=placeholder_config,
+        comment_validation_config=loader.get_comment_validation_config(),
+        placeholder_case_sensitive=case_sensitive,
+        # Placeholder matching is one precompiled regex with the case-sensitivity flag baked in. Exact-match
+        # lookups are only kept for patterns whose regex would not match their own literal text (e.g. "(none)").
+        placeholder_regex=loader.get_placeholder_regex(),
+        placeholder_exact=frozenset(
+            pattern if case_sensitive else pattern.lower()
+            for pattern, phrase in zip(placeholder_patterns, loader.get_compiled_placeholder_patterns(), strict=True)
+            if not phrase.match(pattern)
+        ),
+        # Without a ":" a comment can only be a placeholder by matching a whole pattern. When every pattern is
+        # literal text that fixes its length, so other lengths are rejected before the regex runs.
+        placeholder_lengths=(
+            frozenset(len(pattern) for pattern in placeholder_patterns)
+            if all(_LITERAL_PLACEHOLDER.fullmatch(pattern) for pattern in placeholder_patterns)
+            else None
+        ),
+        # Column names repeat heavily across a catalog (id, created_at, ...), so each distinct name is
+        # classified once per process
+        is_critical_name=lru_cache(maxsize=8192)(_build_critical_matcher(loader)),
+    )
+
 
 class DocumentationValidator:
     """Validator for documentation compliance of Databricks tables.
@@ -17,19 +131,45 @@ class DocumentationValidator:
     Supports multiple documentation scenarios.
     """
 
+    # Fixed attribute layout: no per-instance __dict__, and attribute reads on the hot paths skip a dict probe
+    __slots__ = (
+        "_config_loader",
+        "minimum_comment_length",
+        "required_column_coverage_percent",
+        "critical_column_patterns",
+        "placeholder_patterns",
+        "placeholder_config",
+        "comment_validation_config",
+        "_placeholder_case_sensitive",
+        "_placeholder_regex",
+        "_placeholder_exact",
+        "_placeholder_lengths",
+        "_is_critical_name",
+        "_last_scan",
+    )
+
     def __init__(self) -> None:
         """Initialize validator with configuration from YAML file."""
         self._config_loader = get_config_loader()
+        settings = _documentation_settings()
 
         # Load configuration values from YAML
-        self.minimum_comment_length = int(self._config_loader.get_validation_threshold("minimum_comment_length", 10))
-        self.required_column_coverage_percent = float(
-            self._config_loader.get_validation_threshold("required_column_coverage_percent", 80)
-        )
-        self.critical_column_patterns = self._config_loader.get_critical_column_patterns()
-        self.placeholder_patterns = self._config_loader.get_placeholder_patterns()
-        self.placeholder_config = self._config_loader.get_placeholder_detection_config()
-        self.comment_validation_config = self._config_loader.get_comment_validation_config()
+        self.minimum_comment_length = settings.minimum_comment_length
+        self.required_column_coverage_percent = settings.required_column_coverage_percent
+        self.critical_column_patterns = settings.critical_column_patterns
+        self.placeholder_patterns = settings.placeholder_patterns
+        self.placeholder_config = settings.placeholder_config
+        self.comment_validation_config = settings.comment_validation_config
+
+        # Precompiled matchers, shared with every other validator in the process
+        self._placeholder_case_sensitive = settings.placeholder_case_sensitive
+        self._placeholder_regex = settings.placeholder_regex
+        self._placeholder_exact = settings.placeholder_exact
+        self._placeholder_lengths = settings.placeholder_lengths
+        self._is_critical_name = settings.is_critical_name
+
+        # Most recent column scan, keyed by the identity of the (immutable) columns tuple it describes
+        self._last_scan: tuple[object, _ColumnScan] = ((), _EMPTY_SCAN)
 
     def has_comment(self, table: TableInfo) -> bool:
         """Check if table has a meaningful comment.
@@ -44,11 +184,11 @@ class DocumentationValidator:
         Returns:
             True if table has a non-empty comment, False otherwise
         """
-        if table.comment is None:
+        # str.isspace() stops at the first non-whitespace character and, unlike strip(), never copies
+        comment = table.comment
+        if not comment:
             return False
-
-        # Check for whitespace-only strings
-        return bool(table.comment.strip())
+        return not comment.isspace()
 
     def has_minimum_length(self, table: TableInfo) -> bool:
         """Check if table comment meets minimum length requirement.
@@ -59,12 +199,9 @@ class DocumentationValidator:
         Returns:
             True if table comment is at least minimum_comment_length characters, False otherwise
         """
-        if table.comment is None:
-            return False
-
+        comment = table.comment
         # Count characters in the comment (Unicode-aware)
-        comment_length = len(table.comment)
-        return comment_length >= self.minimum_comment_length
+        return comment is not None and len(comment) >= self.minimum_comment_length
 
     def has_placeholder_comment(self, table: TableInfo) -> bool:
         """Check if table comment appears to be placeholder text.
@@ -79,72 +216,59 @@ class DocumentationValidator:
         Returns:
             True if table comment appears to be placeholder text, False otherwise
         """
-        if table.comment is None or table.comment.strip() == "":
+        comment = table.comment
+        if not comment or comment.isspace():
             # Empty or None comments are not considered placeholders
             # (they are handled by has_comment() validator)
             return False
+        return self._is_placeholder_text(comment)
+
+    def analyze_comment(self, table: TableInfo) -> tuple[bool, bool, bool]:
+        """Run the three table comment checks in one call, reading the comment once.
 
-        comment = table.comment.strip()
-        comment_lower = comment.lower()
+        Args:
+            table: TableInfo object with table metadata
 
-        # Use placeholder patterns from configuration
-        import re
+        Returns:
+            Results of has_comment(), has_minimum_length() and has_placeholder_comment(), in that order
+        """
+        comment = table.comment
+        if comment is None:
+            return False, False, False
 
-        exact_patterns = self.placeholder_patterns
-        case_sensitive = self.placeholder_config.get("case_sensitive", False)
+        has_text = bool(comment) and not comment.isspace()
+        meets_minimum = len(comment) >= self.minimum_comment_length
+        return has_text, meets_minimum, has_text and self._is_placeholder_text(comment)
 
-        # Determine comment to check based on case sensitivity
-        check_comment = comment if case_sensitive else comment_lower
+    def _is_placeholder_text(self, comment: str) -> bool:
+        """Placeholder check for a comment already known to contain non-whitespace text."""
+        comment = comment.strip()
 
-        for pattern in exact_patterns:
-            check_pattern = pattern if case_sensitive else pattern.lower()
-            # Check for exact match
-            if check_comment == check_pattern:
-                return True
+        lengths = self._placeholder_lengths
+        if lengths is not None and len(comment) not in lengths and ":" not in comment:
+            return False
 
-        # Check for common placeholder phrases (obvious placeholder usage)
-        placeholder_phrases = [rf"^\s*{pattern}\s*:" for pattern in exact_patterns] + [  # "PATTERN:" at start
-            rf"^\s*{pattern}\s*$" for pattern in exact_patterns  # "PATTERN" as complete comment
-        ]
+        # Common placeholder phrases: "PATTERN:" at start or "PATTERN" as complete comment
+        if self._placeholder_regex.match(comment):
+            return True
 
-        return any(re.search(phrase_pattern, check_comment) for phrase_pattern in placeholder_phrases)
+        # Exact match against a configured placeholder the regex cannot see
+        exact = self._placeholder_exact
+        return bool(exact) and (comment if self._placeholder_case_sensitive else comment.lower()) in exact
 
-    def _is_column_critical(self, column_name_lower: str, patterns_with_boundaries: list[dict]) -> bool:
+    def _is_column_critical(self, column_name: str) -> bool:
         """Check if a column name matches any critical pattern using appropriate matching strategy.
 
+        Word-boundary patterns match user_id, customer_id, id, UserId, customerId (but not humidity);
+        substring patterns match anywhere, e.g. email_address, user_email, email.
+
         Args:
-            column_name_lower: Column name in lowercase
-            patterns_with_boundaries: List of pattern dicts with 'pattern' and 'word_boundary' fields
+            column_name: Column name as reported by the catalog
 
         Returns:
             True if column matches any critical pattern, False otherwise
         """
-        for pattern_info in patterns_with_boundaries:
-            pattern = pattern_info["pattern"].lower()
-            use_word_boundary = pattern_info.get("word_boundary", False)
-
-            if use_word_boundary:
-                # Use word boundary matching - pattern must be a complete word or word part
-                # Handle both underscore_case and camelCase patterns
-                # Match: user_id, customer_id, id, UserId, customerId (but not humidity_relative_id)
-                escaped_pattern = re.escape(pattern)
-                word_patterns = [
-                    rf"^{escaped_pattern}$",  # Exact match: "id"
-                    rf"^{escaped_pattern}_",  # Start with underscore: "id_something"
-                    rf"_{escaped_pattern}_",  # Middle with underscore: "user_id_field"
-                    rf"_{escaped_pattern}$",  # End with underscore: "user_id"
-                    rf"{escaped_pattern}$",  # End of camelCase: "userId", "customerId"
-                    rf"^{escaped_pattern}(?=[A-Z])",  # Start of camelCase: "idField" -> "id" + "Field"
-                ]
-                if any(re.search(wp, column_name_lower) for wp in word_patterns):
-                    return True
-            else:
-                # Use substring matching - pattern can appear anywhere
-                # Match patterns like: email_address, user_email, email
-                if pattern in column_name_lower:
-                    return True
-
-        return False
+        return self._is_critical_name(column_name)
 
     def get_undocumented_critical_columns(self, table: TableInfo) -> list[str]:
         """Get list of critical columns that lack documentation.
@@ -162,28 +286,7 @@ class DocumentationValidator:
         Returns:
             List of column names that are critical but lack documentation
         """
-        if not table.columns:
-            return []
-
-        # Get critical patterns with word boundary settings from configuration
-        critical_patterns_with_boundaries = get_config_loader().get_critical_column_patterns_with_boundaries()
-
-        undocumented_critical = []
-
-        for col in table.columns:
-            col_name_lower = col.name.lower()
-
-            # Check if column is critical using appropriate matching strategy
-            is_critical = self._is_column_critical(col_name_lower, critical_patterns_with_boundaries)
-
-            if is_critical:
-                # Check if column has documentation
-                has_documentation = bool(col.comment and col.comment.strip())
-
-                if not has_documentation:
-                    undocumented_critical.append(col.name)
-
-        return undocumented_critical
+        return list(self._scan_columns(table).undocumented_critical)
 
     def has_all_critical_columns_documented(self, table: TableInfo) -> bool:
         """Check if all critical columns in the table have documentation.
@@ -213,7 +316,7 @@ class DocumentationValidator:
         if not table.columns:
             return 100.0  # No columns = vacuously true = 100% compliant
 
-        documented_count = sum(1 for col in table.columns if col.comment and col.comment.strip())
+        documented_count = self._scan_columns(table).documented_count
 
         return (documented_count / len(table.columns)) * 100.0
 
@@ -228,10 +331,24 @@ class DocumentationValidator:
             True if table meets or exceeds the documentation threshold, False otherwise
         """
         if threshold is None:
-            threshold = float(self._config_loader.get_validation_threshold("required_column_coverage_percent", 80))
-
-        actual_percentage = self.calculate_column_documentation_percentage(table)
-        return actual_percentage >= threshold
+            threshold = self.required_column_coverage_percent
+
+        columns = table.columns
+        if not columns or self._last_scan[0] is columns:
+            # Vacuously compliant, or already scanned: compare the exact percentage
+            return self.calculate_column_documentation_percentage(table) >= threshold
+
+        # Stop at the first undocumented column after which the threshold is out of reach, even if every
+        # remaining column is documented
+        total = len(columns)
+        undocumented = 0
+        for col in columns:
+            comment = col.comment
+            if not comment or comment.isspace():
+                undocumented += 1
+                if ((total - undocumented) / total) * 100.0 < threshold:
+                    return False
+        return ((total - undocumented) / total) * 100.0 >= threshold
 
     def get_undocumented_columns(self, table: TableInfo) -> list[str]:
         """Get list of columns that lack documentation.
@@ -242,13 +359,43 @@ class DocumentationValidator:
         Returns:
             List of column names that lack documentation
         """
-        if not table.columns:
-            return []
+        return list(self._scan_columns(table).undocumented)
 
-        undocumented = []
-        for col in table.columns:
-            has_documentation = bool(col.comment and col.comment.strip())
-            if not has_documentation:
-                undocumented.append(col.name)
+    def _scan_columns(self, table: TableInfo) -> _ColumnScan:
+        """Walk the table's columns once, recording documentation status and critical matches.
+
+        The coverage, undocumented and critical-column checks all read this scan. The last result is
+        reused while the same columns tuple is passed in again, as happens when several checks run on one table.
+
+        Args:
+            table: TableInfo object with table metadata including columns
+
+        Returns:
+            Documented column count plus the undocumented and undocumented critical column names
+        """
+        columns = table.columns
+        if not columns:
+            return _EMPTY_SCAN
+
+        last_columns, last_scan = self._last_scan
+        if columns is last_columns:
+            return last_scan
 
-        return undocumented
+        documented_count = 0
+        undocumented = []
+        undocumented_critical = []
+        for col in columns:
+            comment = col.comment
+            if comment and not comment.isspace():
+                documented_count += 1
+                continue
+            undocumented.append(col.name)
+            # Check if column is critical using appropriate matching strategy
+            if self._is_column_critical(col.name):
+                undocumented_critical.append(col.name)
+
+        scan = _ColumnScan(documented_count, tuple(undocumented), tuple(undocumented_critical))
+        # Lists are mutable, so only tuples (the discovery default) are safe to recognise by identity
+        if isinstance(columns, tuple):
+            self._last_scan = (columns, scan)
+        return scan